@@ -75,6 +75,11 @@ CREATE INDEX idx_listing_date ON book_listings(listing_date);
 CREATE INDEX idx_is_active ON book_listings(is_active);
 CREATE INDEX idx_crawl_session ON book_listings(crawl_session_id);
 
+-- Partial indexes for monitor cleanup and statistics queries
+CREATE INDEX idx_inactive_updated ON book_listings(updated_at) WHERE is_active = false;
+CREATE INDEX idx_active_location ON book_listings(location) WHERE is_active = true;
+CREATE INDEX idx_completed_end_time ON crawl_sessions(end_time) WHERE status = 'completed';
+
 -- Update trigger for updated_at
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -28,6 +28,7 @@ setup(
     install_requires=[
         "selenium>=4.18.1",
         "beautifulsoup4>=4.12.3",
+        "lxml>=5.1.0",
         "sqlalchemy>=2.0.25",
         "loguru>=0.7.2",
         "pyyaml>=6.0.1",
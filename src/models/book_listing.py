@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .base import Base, TimestampMixin
@@ -46,5 +46,11 @@ class BookListing(Base, TimestampMixin):
     crawl_session_id = Column(Integer, ForeignKey('crawl_sessions.id'))
     crawl_session = relationship("CrawlSession", back_populates="listings")
     
+    # Partial indexes matching the monitor's cleanup and location stats filters
+    __table_args__ = (
+        Index('idx_inactive_updated', 'updated_at', postgresql_where=(is_active == False)),
+        Index('idx_active_location', location, postgresql_where=(is_active == True)),
+    )
+    
     def __repr__(self):
         return f"<BookListing(id={self.id}, title='{self.title[:50]}...', price={self.price})>"
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .base import Base, TimestampMixin
@@ -27,5 +27,10 @@ class CrawlSession(Base, TimestampMixin):
     # Relationships
     listings = relationship("BookListing", back_populates="crawl_session")
     
+    # Partial index matching the monitor's cleanup of completed sessions
+    __table_args__ = (
+        Index('idx_completed_end_time', end_time, postgresql_where=(status == 'completed')),
+    )
+    
     def __repr__(self):
         return f"<CrawlSession(id={self.id}, status={self.status}, listings={self.total_listings_found})>"
\ No newline at end of file
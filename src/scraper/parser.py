@@ -1,10 +1,46 @@
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from typing import Dict, List, Optional
 import re
 from datetime import datetime, timedelta
 from loguru import logger
 import json
 
+def _with_class(path: str, css_class: str) -> etree.XPath:
+    """Compile an XPath matching elements that carry the given CSS class"""
+    return etree.XPath(
+        f"{path}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+    )
+
+def _first(elements: list):
+    """Return the first matched element or None"""
+    return elements[0] if elements else None
+
+# Search result pages are the hot path, so they are walked with precompiled
+# XPath expressions on the raw lxml tree instead of BeautifulSoup objects
+_SEARCH_LISTINGS = _with_class('//article', 'aditem')
+_SEARCH_LINK = etree.XPath('.//a[@href]')
+_SEARCH_TITLE = _with_class('.//h2', 'text-module-begin')
+_SEARCH_PRICE = _with_class('.//p', 'aditem-main--middle--price')
+_SEARCH_LOCATION = _with_class('.//div', 'aditem-main--top--left')
+_SEARCH_DATE = _with_class('.//div', 'aditem-main--top--right')
+_SEARCH_IMAGE = etree.XPath('.//img')
+
+# Text patterns are compiled once at import instead of on every call
+_POSTAL_CODE_RE = re.compile(r'\b(\d{5})\b')
+_VIEW_COUNT_RE = re.compile(r'\d+\s*mal aufgerufen')
+_NUMBER_RE = re.compile(r'(\d+)')
+_CURRENCY_RE = re.compile(r'[€$£]')
+_PRICE_SUFFIX_RE = re.compile(r'(eur|euro|vb|vhb|festpreis)', re.IGNORECASE)
+_PRICE_RE = re.compile(r'(\d+(?:\.\d+)?)')
+_DAYS_AGO_RE = re.compile(r'vor\s+(\d+)\s+tag')
+_HOURS_AGO_RE = re.compile(r'vor\s+(\d+)\s+stunde')
+_MINUTES_AGO_RE = re.compile(r'vor\s+(\d+)\s+minute')
+_DATE_RE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')
+_DATE_PREFIX_RE = re.compile(r'(eingestellt am|online seit|seit)\s*', re.IGNORECASE)
+_CONTACT_LABEL_RE = re.compile('Ansprechpartner')
+
 class ListingParser:
     """Parser for Kleinanzeigen listing pages"""
     
@@ -14,46 +50,51 @@ class ListingParser:
     def parse_search_results(self, html: str) -> List[Dict]:
         """Parse search results page and extract listing URLs and basic info"""
         results = []
-        self.soup = BeautifulSoup(html, 'lxml')
+        if not html or not html.strip():
+            return results
         
         try:
             # Find all listing items
-            listings = self.soup.find_all('article', class_='aditem')
+            # Parse UTF-8 bytes: lxml rejects str input carrying an encoding declaration
+            tree = lxml_html.document_fromstring(
+                html.encode('utf-8'), parser=lxml_html.HTMLParser(encoding='utf-8')
+            )
+            listings = _SEARCH_LISTINGS(tree)
             
             for listing in listings:
                 try:
                     listing_data = {}
                     
                     # Extract URL
-                    link = listing.find('a', href=True)
-                    if link:
-                        listing_data['url'] = link['href']
+                    link = _first(_SEARCH_LINK(listing))
+                    if link is not None:
+                        listing_data['url'] = link.get('href')
                         if not listing_data['url'].startswith('http'):
                             listing_data['url'] = f"https://www.kleinanzeigen.de{listing_data['url']}"
                     
                     # Extract title
-                    title_elem = listing.find('h2', class_='text-module-begin')
-                    if title_elem:
-                        listing_data['title'] = title_elem.text.strip()
+                    title_elem = _first(_SEARCH_TITLE(listing))
+                    if title_elem is not None:
+                        listing_data['title'] = title_elem.text_content().strip()
                     
                     # Extract price
-                    price_elem = listing.find('p', class_='aditem-main--middle--price')
-                    if price_elem:
-                        listing_data['price'] = self.clean_price(price_elem.text)
+                    price_elem = _first(_SEARCH_PRICE(listing))
+                    if price_elem is not None:
+                        listing_data['price'] = self.clean_price(price_elem.text_content())
                     
                     # Extract location
-                    location_elem = listing.find('div', class_='aditem-main--top--left')
-                    if location_elem:
-                        listing_data['location'] = location_elem.text.strip()
+                    location_elem = _first(_SEARCH_LOCATION(listing))
+                    if location_elem is not None:
+                        listing_data['location'] = location_elem.text_content().strip()
                     
                     # Extract date
-                    date_elem = listing.find('div', class_='aditem-main--top--right')
-                    if date_elem:
-                        listing_data['date'] = self.parse_relative_date(date_elem.text.strip())
+                    date_elem = _first(_SEARCH_DATE(listing))
+                    if date_elem is not None:
+                        listing_data['date'] = self.parse_relative_date(date_elem.text_content().strip())
                     
                     # Extract image
-                    img_elem = listing.find('img')
-                    if img_elem:
+                    img_elem = _first(_SEARCH_IMAGE(listing))
+                    if img_elem is not None:
                         listing_data['thumbnail'] = img_elem.get('src') or img_elem.get('data-src')
                     
                     if 'url' in listing_data:
@@ -94,7 +135,7 @@ class ListingParser:
             if locality:
                 listing_data['location'] = locality.text.strip()
                 # Extract postal code
-                postal_match = re.search(r'\b(\d{5})\b', listing_data['location'])
+                postal_match = _POSTAL_CODE_RE.search(listing_data['location'])
                 if postal_match:
                     listing_data['postal_code'] = postal_match.group(1)
             
@@ -116,9 +157,9 @@ class ListingParser:
             listing_data['images'] = self._extract_image_urls()
             
             # Extract view count
-            view_elem = self.soup.find(text=re.compile(r'\d+\s*mal aufgerufen'))
+            view_elem = self.soup.find(text=_VIEW_COUNT_RE)
             if view_elem:
-                view_match = re.search(r'(\d+)', view_elem)
+                view_match = _NUMBER_RE.search(view_elem)
                 if view_match:
                     listing_data['view_count'] = int(view_match.group(1))
             
@@ -213,14 +254,14 @@ class ListingParser:
         
         # Extract numeric value
         # Remove currency symbols and text
-        price_str = re.sub(r'[€$£]', '', price_str)
-        price_str = re.sub(r'(eur|euro|vb|vhb|festpreis)', '', price_str, flags=re.IGNORECASE)
+        price_str = _CURRENCY_RE.sub('', price_str)
+        price_str = _PRICE_SUFFIX_RE.sub('', price_str)
         
         # Replace German decimal separator
         price_str = price_str.replace('.', '').replace(',', '.')
         
         # Extract first number
-        match = re.search(r'(\d+(?:\.\d+)?)', price_str)
+        match = _PRICE_RE.search(price_str)
         if match:
             try:
                 return float(match.group(1))
@@ -246,25 +287,25 @@ class ListingParser:
                 return (now - timedelta(days=2)).replace(hour=0, minute=0, second=0, microsecond=0)
             else:
                 # Try to parse "vor X Tagen" (X days ago)
-                days_match = re.search(r'vor\s+(\d+)\s+tag', date_str)
+                days_match = _DAYS_AGO_RE.search(date_str)
                 if days_match:
                     days = int(days_match.group(1))
                     return (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
                 
                 # Try to parse "vor X Stunden" (X hours ago)
-                hours_match = re.search(r'vor\s+(\d+)\s+stunde', date_str)
+                hours_match = _HOURS_AGO_RE.search(date_str)
                 if hours_match:
                     hours = int(hours_match.group(1))
                     return now - timedelta(hours=hours)
                 
                 # Try to parse "vor X Minuten" (X minutes ago)
-                minutes_match = re.search(r'vor\s+(\d+)\s+minute', date_str)
+                minutes_match = _MINUTES_AGO_RE.search(date_str)
                 if minutes_match:
                     minutes = int(minutes_match.group(1))
                     return now - timedelta(minutes=minutes)
                 
                 # Try standard date format (DD.MM.YYYY)
-                date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', date_str)
+                date_match = _DATE_RE.search(date_str)
                 if date_match:
                     day, month, year = map(int, date_match.groups())
                     return datetime(year, month, day)
@@ -280,7 +321,7 @@ class ListingParser:
             return None
             
         # Remove "Eingestellt am" or similar prefixes
-        date_text = re.sub(r'(eingestellt am|online seit|seit)\s*', '', date_text, flags=re.IGNORECASE)
+        date_text = _DATE_PREFIX_RE.sub('', date_text)
         
         return self.parse_relative_date(date_text)
     
@@ -300,7 +341,7 @@ class ListingParser:
                 contact_info['phone'] = phone_elem.text.strip()
             
             # Extract contact name
-            contact_name = soup.find('span', class_='text-bold', text=re.compile('Ansprechpartner'))
+            contact_name = soup.find('span', class_='text-bold', text=_CONTACT_LABEL_RE)
             if contact_name:
                 name_value = contact_name.find_next_sibling('span')
                 if name_value:
@@ -1,13 +1,21 @@
-from apscheduler.schedulers.blocking import BlockingScheduler
+import threading
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from loguru import logger
 from typing import Callable, Dict
 
 class TaskScheduler:
-    """Schedule crawler tasks"""
+    """Schedule crawler tasks
+    
+    Jobs run on APScheduler's background thread pool, so adding and listing
+    jobs never blocks the caller. Overdue runs are coalesced into one and a
+    job never overlaps with itself. start() still blocks until stop() is
+    called or the process is interrupted.
+    """
     
     def __init__(self):
-        self.scheduler = BlockingScheduler()
+        self.scheduler = BackgroundScheduler(job_defaults={'coalesce': True, 'max_instances': 1})
+        self._stopped = threading.Event()
         
     def add_cron_job(self, func: Callable, cron_expression: str, job_id: str):
         """Add a cron job to the scheduler"""
@@ -21,10 +29,12 @@ class TaskScheduler:
         logger.info(f"Scheduled job {job_id} with cron: {cron_expression}")
         
     def start(self):
-        """Start the scheduler"""
+        """Start the scheduler and wait until it is stopped"""
         logger.info("Starting scheduler...")
+        self._stopped.clear()
+        self.scheduler.start()
         try:
-            self.scheduler.start()
+            self._stopped.wait()
         except KeyboardInterrupt:
             logger.info("Scheduler stopped by user")
             self.scheduler.shutdown()
@@ -32,4 +42,5 @@ class TaskScheduler:
     def stop(self):
         """Stop the scheduler"""
         self.scheduler.shutdown()
-        logger.info("Scheduler stopped")
\ No newline at end of file
+        self._stopped.set()
+        logger.info("Scheduler stopped")
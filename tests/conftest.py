@@ -4,9 +4,9 @@ Pytest configuration and fixtures for Kleinanzeigen Crawler tests
 """
 
 import pytest
+import importlib
 import os
 import sys
-import tempfile
 import yaml
 from pathlib import Path
 
@@ -14,6 +14,27 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Heavy modules shared by most test files, imported once per session
+PRELOAD_MODULES = (
+    'src.config.config_loader',
+    'src.models',
+    'src.utils.error_handler',
+    'src.utils.notifications',
+    'src.scraper.parser',
+    'selenium.common.exceptions',
+    'requests.exceptions',
+)
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_modules():
+    """Import slow third-party and project modules once up front"""
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            # Tests needing a missing module report it themselves
+            pass
+
 @pytest.fixture
 def sample_config():
     """Provide sample configuration for tests"""
@@ -69,16 +90,15 @@ def sample_config():
     }
 
 @pytest.fixture
-def temp_config_file(sample_config):
+def temp_config_file(sample_config, tmp_path):
     """Create a temporary config file for tests"""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+    # tmp_path is unique per test and per xdist worker, so parallel runs
+    # never share the file
+    config_path = tmp_path / 'config.yaml'
+    with open(config_path, 'w') as f:
         yaml.dump(sample_config, f)
-        config_path = f.name
-    
-    yield config_path
     
-    # Cleanup
-    os.unlink(config_path)
+    return str(config_path)
 
 @pytest.fixture
 def sample_listing_data():
@@ -169,11 +189,10 @@ def sample_search_results_html():
 def mock_selenium_driver():
     """Provide a mock Selenium driver for tests"""
     from unittest.mock import MagicMock
+    from selenium import webdriver
     
-    driver = MagicMock()
-    driver.get.return_value = None
-    driver.quit.return_value = None
-    driver.find_element.return_value = MagicMock()
+    # spec_set seals the mock to the real WebDriver API so typos fail loudly
+    driver = MagicMock(spec_set=webdriver.Chrome)
     driver.find_elements.return_value = [MagicMock()]
     driver.current_url = "https://www.kleinanzeigen.de/test"
     driver.page_source = "<html><body>Test</body></html>"
@@ -184,15 +203,9 @@ def mock_selenium_driver():
 def mock_database_session():
     """Provide a mock database session for tests"""
     from unittest.mock import MagicMock
+    from sqlalchemy.orm import Session
     
-    session = MagicMock()
-    session.add.return_value = None
-    session.commit.return_value = None
-    session.rollback.return_value = None
-    session.close.return_value = None
-    session.query.return_value = MagicMock()
-    
-    return session
+    return MagicMock(spec_set=Session)
 
 # Test markers
 def pytest_configure(config):
@@ -216,9 +229,26 @@ def pytest_configure(config):
         "markers", "functional: mark test as functional test"
     )
 
+# Environment switches that skip tests carrying the matching marker
+SKIP_ENV_VARS = {
+    'selenium': ('SKIP_SELENIUM_TESTS', "Selenium tests skipped"),
+    'network': ('SKIP_NETWORK_TESTS', "Network tests skipped"),
+    'database': ('SKIP_DATABASE_TESTS', "Database tests skipped"),
+}
+
 # Test collection hooks
+# tryfirst: assign markers before the cacheprovider's --lf/--ff hooks reorder
+# and deselect items
+@pytest.hookimpl(tryfirst=True)
 def pytest_collection_modifyitems(config, items):
-    """Modify test collection to add markers based on path"""
+    """Modify test collection to add markers based on path and apply skips"""
+    # Resolve the skip switches once instead of once per test
+    skip_markers = {
+        marker: pytest.mark.skip(reason=reason)
+        for marker, (env_var, reason) in SKIP_ENV_VARS.items()
+        if os.getenv(env_var, '').lower() == 'true'
+    }
+    
     for item in items:
         # Add markers based on test path
         if "unit" in str(item.fspath):
@@ -229,27 +259,18 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.functional)
         
         # Add markers based on test name
-        if "selenium" in item.name.lower():
+        name = item.name.lower()
+        if "selenium" in name:
             item.add_marker(pytest.mark.selenium)
-        if "database" in item.name.lower():
+        if "database" in name:
             item.add_marker(pytest.mark.database)
-        if "network" in item.name.lower():
+        if "network" in name:
             item.add_marker(pytest.mark.network)
-
-# Skip conditions
-def pytest_runtest_setup(item):
-    """Setup function to skip tests based on environment"""
-    # Skip selenium tests if explicitly disabled
-    if "selenium" in [mark.name for mark in item.iter_markers()]:
-        if os.getenv('SKIP_SELENIUM_TESTS', '').lower() == 'true':
-            pytest.skip("Selenium tests skipped")
-    
-    # Skip network tests if explicitly disabled
-    if "network" in [mark.name for mark in item.iter_markers()]:
-        if os.getenv('SKIP_NETWORK_TESTS', '').lower() == 'true':
-            pytest.skip("Network tests skipped")
-    
-    # Skip database tests if explicitly disabled
-    if "database" in [mark.name for mark in item.iter_markers()]:
-        if os.getenv('SKIP_DATABASE_TESTS', '').lower() == 'true':
-            pytest.skip("Database tests skipped")
\ No newline at end of file
+        
+        # Skip tests based on environment
+        if skip_markers:
+            marker_names = {mark.name for mark in item.iter_markers()}
+            for marker, skip in skip_markers.items():
+                if marker in marker_names:
+                    item.add_marker(skip)
+                    break
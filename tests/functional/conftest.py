@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Shared fixtures for functional tests
+Deterministic setup is built once per session (or module) and reused
+"""
+
+import pytest
+import yaml
+
+@pytest.fixture(scope="session")
+def production_config():
+    """Provide the production-like test configuration (read-only)"""
+    return {
+        'search': {
+            'category': 'antike-buecher',
+            'location': 'Karlsruhe',
+            'radius_km': 5,
+            'max_price': 0,
+            'keywords': ['test']
+        },
+        'selenium': {
+            'headless': True,
+            'page_load_timeout': 10,
+            'implicit_wait': 5
+        },
+        'crawler': {
+            'max_pages': 1,
+            'delay_between_requests': 1,
+            'retry_attempts': 2
+        },
+        'database': {
+            'host': 'localhost',
+            'name': 'test_db',
+            'user': 'test_user',
+            'password': 'test_pass'
+        },
+        'logging': {
+            'level': 'DEBUG'
+        }
+    }
+
+@pytest.fixture(scope="session")
+def production_config_file(production_config, tmp_path_factory):
+    """Write the production-like configuration to a YAML file once per session"""
+    config_path = tmp_path_factory.mktemp("config") / "config.yaml"
+    with open(config_path, 'w') as f:
+        yaml.dump(production_config, f)
+    
+    return str(config_path)
+
+@pytest.fixture(scope="module")
+def listing_parser():
+    """Provide a single ListingParser instance shared by a test module"""
+    from src.scraper.parser import ListingParser
+    
+    return ListingParser()
+
+@pytest.fixture(scope="session")
+def shared_crawler(production_config):
+    """Start one headless browser for the whole session
+    
+    Launching Chrome takes seconds, so tests share a single driver and
+    only reset its state between tests (see the crawler fixture).
+    """
+    try:
+        from requests.exceptions import RequestException
+        from selenium.common.exceptions import WebDriverException
+        from src.scraper.crawler import KleinanzeigenCrawler
+    except ImportError:
+        pytest.skip("Selenium not available")
+    
+    # Only a driver that cannot start or be downloaded skips; other errors surface
+    try:
+        crawler = KleinanzeigenCrawler(production_config['selenium'])
+    except (WebDriverException, RequestException) as e:
+        pytest.skip(f"Browser unavailable: {e}")
+    
+    yield crawler
+    crawler.close()
+
+@pytest.fixture
+def crawler(shared_crawler):
+    """Provide the shared crawler with a clean browser state"""
+    shared_crawler.driver.delete_all_cookies()
+    shared_crawler.driver.get('about:blank')
+    return shared_crawler
@@ -5,24 +5,90 @@ These tests verify the complete workflow from configuration to notification
 """
 
 import sys
-import os
-import tempfile
 import json
 import uuid
 from datetime import datetime
+from typing import List, NamedTuple, Optional
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import pytest
+import yaml
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+class SampleListing(NamedTuple):
+    """Immutable listing record shared by all end-to-end tests"""
+    listing_id: str
+    title: str
+    description: str
+    price: float
+    location: str
+    postal_code: str
+    seller_name: str
+    seller_type: str
+    listing_url: str
+    thumbnail_url: str
+    image_urls: List[str]
+    phone_number: Optional[str]
+    listing_date: datetime
+    view_count: int
+    
+    def as_dict(self) -> dict:
+        """Return the listing as the dict shape produced by the crawler"""
+        return dict(self._asdict())
+
+SAMPLE_LISTINGS = [
+    SampleListing(
+        listing_id='test_123',
+        title='Antike Bücher Sammlung',
+        description='Eine wundervolle Sammlung antiker Bücher',
+        price=0,
+        location='76133 Karlsruhe',
+        postal_code='76133',
+        seller_name='Test Verkäufer',
+        seller_type='private',
+        listing_url='https://www.kleinanzeigen.de/s-anzeige/test/123',
+        thumbnail_url='https://example.com/thumb.jpg',
+        image_urls=['https://example.com/image1.jpg'],
+        phone_number=None,
+        listing_date=datetime.now(),
+        view_count=42
+    )
+]
+
+@pytest.fixture
+def patched_db():
+    """Patch the SQLAlchemy engine and session factory used by DatabaseManager"""
+    with patch('src.config.database.create_engine') as mock_engine:
+        with patch('src.config.database.sessionmaker') as mock_sessionmaker:
+            
+            # Setup database mocks
+            mock_db_engine = MagicMock()
+            mock_engine.return_value = mock_db_engine
+            
+            mock_session_class = MagicMock()
+            mock_sessionmaker.return_value = mock_session_class
+            
+            mock_db_session = MagicMock()
+            mock_session_class.return_value = mock_db_session
+            
+            # Setup context manager
+            mock_session_class.return_value.__enter__.return_value = mock_db_session
+            mock_session_class.return_value.__exit__.return_value = None
+            
+            yield mock_db_session
+
 class TestEndToEnd:
     """End-to-end workflow tests"""
     
-    def setup_method(self):
-        """Setup test environment"""
-        self.test_config = {
+    @classmethod
+    def setup_class(cls):
+        """Setup test environment shared by all tests in the class"""
+        cls.test_config = {
             'search': {
                 'category': 'antike-buecher',
                 'location': 'Karlsruhe',
@@ -60,31 +126,12 @@ class TestEndToEnd:
                 'level': 'DEBUG'
             }
         }
-        
-        self.sample_listings = [
-            {
-                'listing_id': 'test_123',
-                'title': 'Antike Bücher Sammlung',
-                'description': 'Eine wundervolle Sammlung antiker Bücher',
-                'price': 0,
-                'location': '76133 Karlsruhe',
-                'postal_code': '76133',
-                'seller_name': 'Test Verkäufer',
-                'seller_type': 'private',
-                'listing_url': 'https://www.kleinanzeigen.de/s-anzeige/test/123',
-                'thumbnail_url': 'https://example.com/thumb.jpg',
-                'image_urls': ['https://example.com/image1.jpg'],
-                'phone_number': None,
-                'listing_date': datetime.now(),
-                'view_count': 42
-            }
-        ]
     
     @patch('src.scraper.crawler.webdriver.Chrome')
     @patch('src.config.database.create_engine')
     @patch('src.config.database.sessionmaker')
     @patch('src.utils.notifications.smtplib.SMTP')
-    def test_complete_crawl_workflow(self, mock_smtp, mock_sessionmaker, mock_engine, mock_chrome):
+    def test_complete_crawl_workflow(self, mock_smtp, mock_sessionmaker, mock_engine, mock_chrome, tmp_path):
         """Test complete crawl workflow from start to finish"""
         
         # Setup mocks
@@ -104,7 +151,6 @@ class TestEndToEnd:
         mock_smtp.return_value.__enter__.return_value = mock_smtp_instance
         
         # Mock driver behavior
-        mock_driver.get.return_value = None
         mock_driver.current_url = "https://www.kleinanzeigen.de/s-antike-buecher/k0"
         mock_driver.page_source = """
         <html>
@@ -121,58 +167,51 @@ class TestEndToEnd:
         """
         
         mock_driver.find_elements.return_value = [MagicMock()]
-        mock_driver.find_element.return_value = MagicMock()
         
         # Create temporary config file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            import yaml
-            yaml.dump(self.test_config, f)
-            config_path = f.name
-        
-        try:
-            # Import and test the main workflow
-            from src.config.config_loader import ConfigLoader
-            from src.scraper.crawler import KleinanzeigenCrawler
-            from src.config.database import DatabaseManager
-            from src.utils.notifications import NotificationManager
-            
-            # Initialize components
-            config_loader = ConfigLoader(config_path)
-            crawler = KleinanzeigenCrawler(config_loader.get('selenium'))
-            db_manager = DatabaseManager(config_loader.get('database'))
-            notifier = NotificationManager(config_loader.get('notifications'))
-            
-            # Test search functionality
-            search_params = config_loader.get('search')
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(self.test_config, Dumper=YAML_DUMPER))
+        
+        # Import and test the main workflow
+        from src.config.config_loader import ConfigLoader
+        from src.scraper.crawler import KleinanzeigenCrawler
+        from src.config.database import DatabaseManager
+        from src.utils.notifications import NotificationManager
+        
+        # Initialize components
+        config_loader = ConfigLoader(str(config_path))
+        crawler = KleinanzeigenCrawler(config_loader.get('selenium'))
+        db_manager = DatabaseManager(config_loader.get('database'))
+        notifier = NotificationManager(config_loader.get('notifications'))
+        
+        # Test search functionality
+        search_params = config_loader.get('search')
+        
+        # Mock the search_books method to return URLs
+        with patch.object(crawler, 'search_books') as mock_search:
+            mock_search.return_value = ['https://www.kleinanzeigen.de/s-anzeige/test/123']
             
-            # Mock the search_books method to return URLs
-            with patch.object(crawler, 'search_books') as mock_search:
-                mock_search.return_value = ['https://www.kleinanzeigen.de/s-anzeige/test/123']
+            # Mock get_listing_details to return structured data
+            with patch.object(crawler, 'get_listing_details') as mock_get_details:
+                mock_get_details.return_value = SAMPLE_LISTINGS[0].as_dict()
                 
-                # Mock get_listing_details to return structured data
-                with patch.object(crawler, 'get_listing_details') as mock_get_details:
-                    mock_get_details.return_value = self.sample_listings[0]
-                    
-                    # Execute search
-                    listing_urls = crawler.search_books(search_params)
-                    assert len(listing_urls) == 1
-                    
-                    # Process listings
-                    listing_data = crawler.get_listing_details(listing_urls[0])
-                    assert listing_data is not None
-                    assert listing_data['title'] == 'Antike Bücher Sammlung'
-                    
-                    # Test notification
-                    notifier.notify_new_listings([listing_data])
-                    
-                    # Verify SMTP was called
-                    mock_smtp.assert_called_once()
-            
-            # Cleanup
-            crawler.close()
-            
-        finally:
-            os.unlink(config_path)
+                # Execute search
+                listing_urls = crawler.search_books(search_params)
+                assert len(listing_urls) == 1
+                
+                # Process listings
+                listing_data = crawler.get_listing_details(listing_urls[0])
+                assert listing_data is not None
+                assert listing_data['title'] == 'Antike Bücher Sammlung'
+                
+                # Test notification
+                notifier.notify_new_listings([listing_data])
+                
+                # Verify SMTP was called
+                mock_smtp.assert_called_once()
+        
+        # Cleanup
+        crawler.close()
     
     def test_error_recovery_workflow(self):
         """Test error recovery during crawl workflow"""
@@ -196,58 +235,94 @@ class TestEndToEnd:
             
             crawler.close()
     
-    def test_data_persistence_workflow(self):
-        """Test data persistence workflow"""
+    @pytest.mark.parametrize("scenario", ["persistence", "monitoring", "cleanup"])
+    def test_storage_workflow(self, patched_db, scenario):
+        """Test database-backed workflows against a shared mocked session"""
+        from src.config.database import DatabaseManager
         
-        with patch('src.config.database.create_engine') as mock_engine:
-            with patch('src.config.database.sessionmaker') as mock_sessionmaker:
-                
-                # Setup database mocks
-                mock_db_engine = MagicMock()
-                mock_engine.return_value = mock_db_engine
-                
-                mock_session_class = MagicMock()
-                mock_sessionmaker.return_value = mock_session_class
-                
-                mock_db_session = MagicMock()
-                mock_session_class.return_value = mock_db_session
-                
-                # Setup context manager
-                mock_session_class.return_value.__enter__.return_value = mock_db_session
-                mock_session_class.return_value.__exit__.return_value = None
-                
-                from src.config.database import DatabaseManager
-                from src.models import BookListing, CrawlSession
-                
-                db_manager = DatabaseManager(self.test_config['database'])
-                
-                # Test session creation
-                with db_manager.get_session() as session:
-                    # Create a crawl session
-                    crawl_session = CrawlSession(
-                        session_id=str(uuid.uuid4()),
-                        start_time=datetime.now(),
-                        status='running'
-                    )
-                    
-                    session.add(crawl_session)
-                    
-                    # Create a book listing
-                    book_listing = BookListing(
-                        listing_id='test_123',
-                        title='Test Book',
-                        price=0,
-                        location='Karlsruhe',
-                        listing_url='https://example.com/test'
-                    )
-                    
-                    session.add(book_listing)
-                    
-                # Verify database operations were called
-                mock_db_session.add.assert_called()
-                mock_db_session.commit.assert_called()
+        workflow = getattr(self, f"_run_{scenario}_workflow")
+        db_manager = DatabaseManager(self.test_config['database'])
+        workflow(db_manager, patched_db)
+    
+    def _run_persistence_workflow(self, db_manager, mock_db_session):
+        """Data persistence workflow"""
+        from src.models import BookListing, CrawlSession
+        
+        # Test session creation
+        with db_manager.get_session() as session:
+            # Create a crawl session
+            crawl_session = CrawlSession(
+                session_id=str(uuid.uuid4()),
+                start_time=datetime.now(),
+                status='running'
+            )
+            
+            session.add(crawl_session)
+            
+            # Create a book listing
+            book_listing = BookListing(
+                listing_id='test_123',
+                title='Test Book',
+                price=0,
+                location='Karlsruhe',
+                listing_url='https://example.com/test'
+            )
+            
+            session.add(book_listing)
+            
+        # Verify database operations were called
+        mock_db_session.add.assert_called()
+        mock_db_session.commit.assert_called()
+    
+    def _run_monitoring_workflow(self, db_manager, mock_db_session):
+        """Monitoring and statistics workflow"""
+        from src.models import CrawlSession
+        
+        # Mock query results
+        mock_db_session.query.return_value.order_by.return_value.limit.return_value.all.return_value = [
+            MagicMock(
+                start_time=datetime.now(),
+                status='completed',
+                total_listings_found=5,
+                new_listings_found=2
+            )
+        ]
+        
+        # Test statistics gathering
+        with db_manager.get_session() as session:
+            sessions = session.query(CrawlSession).order_by(
+                CrawlSession.start_time.desc()
+            ).limit(10).all()
+            
+            assert len(sessions) == 1
+            assert sessions[0].status == 'completed'
+    
+    def _run_cleanup_workflow(self, db_manager, mock_db_session):
+        """Cleanup workflow"""
+        from src.models import BookListing
+        
+        # Mock cleanup operations
+        mock_db_session.query.return_value.filter.return_value.count.return_value = 10
+        mock_db_session.query.return_value.filter.return_value.delete.return_value = 10
+        
+        # Test cleanup operations
+        with db_manager.get_session() as session:
+            # Simulate cleanup of old inactive listings
+            old_listings = session.query(BookListing).filter(
+                BookListing.is_active == False
+            ).count()
+            
+            assert old_listings == 10
+            
+            # Simulate deletion
+            session.query(BookListing).filter(
+                BookListing.is_active == False
+            ).delete()
+            
+            # Verify delete was called
+            mock_db_session.query.return_value.filter.return_value.delete.assert_called()
     
-    def test_configuration_validation_workflow(self):
+    def test_configuration_validation_workflow(self, tmp_path):
         """Test configuration validation workflow"""
         
         # Test with invalid configuration
@@ -260,26 +335,20 @@ class TestEndToEnd:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            import yaml
-            yaml.dump(invalid_config, f)
-            config_path = f.name
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(invalid_config, Dumper=YAML_DUMPER))
         
-        try:
-            from src.config.config_loader import ConfigLoader
-            
-            config_loader = ConfigLoader(config_path)
-            
-            # Test that missing configuration is handled
-            search_config = config_loader.get('search.location', 'default')
-            assert search_config == 'default'
-            
-            # Test that invalid configuration is handled
-            headless_config = config_loader.get('selenium.headless', True)
-            assert headless_config == 'invalid_boolean'  # Raw value returned
-            
-        finally:
-            os.unlink(config_path)
+        from src.config.config_loader import ConfigLoader
+        
+        config_loader = ConfigLoader(str(config_path))
+        
+        # Test that missing configuration is handled
+        search_config = config_loader.get('search.location', 'default')
+        assert search_config == 'default'
+        
+        # Test that invalid configuration is handled
+        headless_config = config_loader.get('selenium.headless', True)
+        assert headless_config == 'invalid_boolean'  # Raw value returned
     
     def test_scheduling_workflow(self):
         """Test scheduling workflow"""
@@ -305,96 +374,6 @@ class TestEndToEnd:
         assert len(jobs) >= 1
         assert jobs[0].id == "test_job"
     
-    def test_monitoring_workflow(self):
-        """Test monitoring and statistics workflow"""
-        
-        with patch('src.config.database.create_engine') as mock_engine:
-            with patch('src.config.database.sessionmaker') as mock_sessionmaker:
-                
-                # Setup database mocks
-                mock_db_engine = MagicMock()
-                mock_engine.return_value = mock_db_engine
-                
-                mock_session_class = MagicMock()
-                mock_sessionmaker.return_value = mock_session_class
-                
-                mock_db_session = MagicMock()
-                mock_session_class.return_value = mock_db_session
-                
-                # Setup context manager
-                mock_session_class.return_value.__enter__.return_value = mock_db_session
-                mock_session_class.return_value.__exit__.return_value = None
-                
-                # Mock query results
-                mock_db_session.query.return_value.order_by.return_value.limit.return_value.all.return_value = [
-                    MagicMock(
-                        start_time=datetime.now(),
-                        status='completed',
-                        total_listings_found=5,
-                        new_listings_found=2
-                    )
-                ]
-                
-                from src.config.database import DatabaseManager
-                from src.models import CrawlSession
-                
-                db_manager = DatabaseManager(self.test_config['database'])
-                
-                # Test statistics gathering
-                with db_manager.get_session() as session:
-                    sessions = session.query(CrawlSession).order_by(
-                        CrawlSession.start_time.desc()
-                    ).limit(10).all()
-                    
-                    assert len(sessions) == 1
-                    assert sessions[0].status == 'completed'
-    
-    def test_cleanup_workflow(self):
-        """Test cleanup workflow"""
-        
-        with patch('src.config.database.create_engine') as mock_engine:
-            with patch('src.config.database.sessionmaker') as mock_sessionmaker:
-                
-                # Setup database mocks
-                mock_db_engine = MagicMock()
-                mock_engine.return_value = mock_db_engine
-                
-                mock_session_class = MagicMock()
-                mock_sessionmaker.return_value = mock_session_class
-                
-                mock_db_session = MagicMock()
-                mock_session_class.return_value = mock_db_session
-                
-                # Setup context manager
-                mock_session_class.return_value.__enter__.return_value = mock_db_session
-                mock_session_class.return_value.__exit__.return_value = None
-                
-                # Mock cleanup operations
-                mock_db_session.query.return_value.filter.return_value.count.return_value = 10
-                mock_db_session.query.return_value.filter.return_value.delete.return_value = 10
-                
-                from src.config.database import DatabaseManager
-                from src.models import BookListing
-                
-                db_manager = DatabaseManager(self.test_config['database'])
-                
-                # Test cleanup operations
-                with db_manager.get_session() as session:
-                    # Simulate cleanup of old inactive listings
-                    old_listings = session.query(BookListing).filter(
-                        BookListing.is_active == False
-                    ).count()
-                    
-                    assert old_listings == 10
-                    
-                    # Simulate deletion
-                    session.query(BookListing).filter(
-                        BookListing.is_active == False
-                    ).delete()
-                    
-                    # Verify delete was called
-                    mock_db_session.query.return_value.filter.return_value.delete.assert_called()
-    
     def teardown_method(self):
         """Cleanup after each test"""
         # Clean up any test files or resources
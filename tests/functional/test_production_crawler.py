@@ -7,8 +7,8 @@ These tests verify that the crawler works correctly in a production-like environ
 import sys
 import os
 import time
-import tempfile
 import json
+import functools
 from pathlib import Path
 from unittest.mock import Mock, patch
 import pytest
@@ -16,71 +16,81 @@ import pytest
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Resolve project modules once at collection time; skip the module if unavailable
+ListingParser = pytest.importorskip('src.scraper.parser').ListingParser
+ConfigLoader = pytest.importorskip('src.config.config_loader').ConfigLoader
+DatabaseManager = pytest.importorskip('src.config.database').DatabaseManager
+NotificationManager = pytest.importorskip('src.utils.notifications').NotificationManager
+ErrorHandler = pytest.importorskip('src.utils.error_handler').ErrorHandler
+_retry = pytest.importorskip('src.utils.retry')
+retry_on_exception, NetworkError = _retry.retry_on_exception, _retry.NetworkError
+setup_logger = pytest.importorskip('src.utils.logger').setup_logger
+TaskScheduler = pytest.importorskip('src.utils.scheduler').TaskScheduler
+
+# Sample HTML that mimics Kleinanzeigen structure
+_SAMPLE_HTML = """
+        <html>
+        <body>
+            <article class="aditem">
+                <a href="/s-anzeige/test-book/123456">
+                    <h2 class="text-module-begin">Test Book Collection</h2>
+                </a>
+                <p class="aditem-main--middle--price">Zu verschenken</p>
+                <div class="aditem-main--top--left">76133 Karlsruhe</div>
+                <div class="aditem-main--top--right">Heute</div>
+                <img src="https://example.com/image.jpg" alt="Test">
+            </article>
+        </body>
+        </html>
+"""
+
+# Search result item used to build large documents for the performance test
+_ARTICLE_TMPL = """
+        <article class="aditem">
+            <a href="/s-anzeige/test-book-{i}/123456">
+                <h2 class="text-module-begin">Test Book {i}</h2>
+            </a>
+            <p class="aditem-main--middle--price">Zu verschenken</p>
+            <div class="aditem-main--top--left">76133 Karlsruhe</div>
+        </article>
+"""
+
+@functools.lru_cache(maxsize=None)
+def _large_html(count=100):
+    """Build a search results page with `count` distinct listings, once per session"""
+    body = ''.join(_ARTICLE_TMPL.format(i=i) for i in range(count))
+    return f"<html><body>{body}</body></html>"
+
+@pytest.fixture(autouse=True, scope='module')
+def mock_smtp():
+    """Keep every test in this module off the network with one shared SMTP mock"""
+    with patch('src.utils.notifications.smtplib.SMTP') as smtp_class:
+        yield smtp_class
+
 class TestProductionCrawler:
     """Functional tests for production crawler"""
     
-    def setup_method(self):
-        """Setup test environment"""
-        self.test_config = {
-            'search': {
-                'category': 'antike-buecher',
-                'location': 'Karlsruhe',
-                'radius_km': 5,
-                'max_price': 0,
-                'keywords': ['test']
-            },
-            'selenium': {
-                'headless': True,
-                'page_load_timeout': 10,
-                'implicit_wait': 5
-            },
-            'crawler': {
-                'max_pages': 1,
-                'delay_between_requests': 1,
-                'retry_attempts': 2
-            },
-            'database': {
-                'host': 'localhost',
-                'name': 'test_db',
-                'user': 'test_user',
-                'password': 'test_pass'
-            },
-            'logging': {
-                'level': 'DEBUG'
-            }
-        }
+    @pytest.fixture(autouse=True)
+    def _use_config(self, production_config):
+        """Expose the shared session configuration to each test"""
+        self.test_config = production_config
     
     @pytest.mark.skipif(os.getenv('SKIP_SELENIUM_TESTS') == 'true', 
                        reason="Selenium tests skipped")
-    def test_crawler_initialization(self):
+    def test_crawler_initialization(self, crawler):
         """Test that crawler can be initialized with production config"""
-        try:
-            from src.scraper.crawler import KleinanzeigenCrawler
-            
-            crawler = KleinanzeigenCrawler(self.test_config['selenium'])
-            assert crawler is not None
-            assert crawler.config == self.test_config['selenium']
-            
-            # Test driver setup
-            crawler.setup_driver()
-            assert crawler.driver is not None
-            assert crawler.wait is not None
-            
-            # Cleanup
-            crawler.close()
-            
-        except ImportError:
-            pytest.skip("Selenium not available")
+        assert crawler is not None
+        assert crawler.config == self.test_config['selenium']
+        
+        # Test driver setup
+        assert crawler.driver is not None
+        assert crawler.wait is not None
     
     @pytest.mark.skipif(os.getenv('SKIP_NETWORK_TESTS') == 'true',
                        reason="Network tests skipped")
-    def test_search_page_access(self):
+    def test_search_page_access(self, crawler):
         """Test that the crawler can access Kleinanzeigen search pages"""
         try:
-            from src.scraper.crawler import KleinanzeigenCrawler
-            
-            crawler = KleinanzeigenCrawler(self.test_config['selenium'])
-            
             # Test basic page access
             search_url = f"{crawler.BASE_URL}/s-antike-buecher/k0"
             crawler.driver.get(search_url)
@@ -92,36 +102,13 @@ class TestProductionCrawler:
             page_source = crawler.driver.page_source
             assert len(page_source) > 1000  # Should have substantial content
             
-            crawler.close()
-            
-        except ImportError:
-            pytest.skip("Selenium not available")
         except Exception as e:
             pytest.skip(f"Network test failed: {e}")
     
     def test_parser_with_real_html(self):
         """Test parser with realistic HTML structure"""
-        from src.scraper.parser import ListingParser
-        
-        # Sample HTML that mimics Kleinanzeigen structure
-        sample_html = """
-        <html>
-        <body>
-            <article class="aditem">
-                <a href="/s-anzeige/test-book/123456">
-                    <h2 class="text-module-begin">Test Book Collection</h2>
-                </a>
-                <p class="aditem-main--middle--price">Zu verschenken</p>
-                <div class="aditem-main--top--left">76133 Karlsruhe</div>
-                <div class="aditem-main--top--right">Heute</div>
-                <img src="https://example.com/image.jpg" alt="Test">
-            </article>
-        </body>
-        </html>
-        """
-        
         parser = ListingParser()
-        results = parser.parse_search_results(sample_html)
+        results = parser.parse_search_results(_SAMPLE_HTML)
         
         assert len(results) == 1
         assert results[0]['title'] == 'Test Book Collection'
@@ -131,8 +118,6 @@ class TestProductionCrawler:
     
     def test_database_connection_mock(self):
         """Test database operations with mock database"""
-        from src.config.database import DatabaseManager
-        
         with patch('src.config.database.create_engine') as mock_engine:
             with patch('src.config.database.sessionmaker') as mock_session:
                 mock_engine.return_value = Mock()
@@ -147,10 +132,8 @@ class TestProductionCrawler:
                 with db_manager.get_session() as session:
                     assert session is not None
     
-    def test_notification_system(self):
+    def test_notification_system(self, mock_smtp):
         """Test notification system with mock SMTP"""
-        from src.utils.notifications import NotificationManager
-        
         config = {
             'enabled': True,
             'email': {
@@ -162,65 +145,49 @@ class TestProductionCrawler:
             }
         }
         
-        with patch('src.utils.notifications.smtplib.SMTP') as mock_smtp:
-            notifier = NotificationManager(config)
-            
-            test_listings = [
-                {
-                    'title': 'Test Book',
-                    'price': 0,
-                    'location': 'Karlsruhe',
-                    'listing_url': 'https://example.com/1'
-                }
-            ]
-            
-            # This should not raise an exception
-            notifier.notify_new_listings(test_listings)
-            
-            # Verify SMTP was called
-            mock_smtp.assert_called_once()
+        # The mock is shared across the module, so count only this test's calls
+        mock_smtp.reset_mock()
+        notifier = NotificationManager(config)
+        
+        test_listings = [
+            {
+                'title': 'Test Book',
+                'price': 0,
+                'location': 'Karlsruhe',
+                'listing_url': 'https://example.com/1'
+            }
+        ]
+        
+        # This should not raise an exception
+        notifier.notify_new_listings(test_listings)
+        
+        # Verify SMTP was called
+        mock_smtp.assert_called_once()
     
-    def test_complete_workflow_mock(self):
+    def test_complete_workflow_mock(self, production_config_file):
         """Test complete workflow with mocked dependencies"""
-        from src.config.config_loader import ConfigLoader
-        
-        # Create temporary config file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            import yaml
-            yaml.dump(self.test_config, f)
-            config_path = f.name
+        # Test config loading
+        config_loader = ConfigLoader(production_config_file)
+        assert config_loader.get('search.location') == 'Karlsruhe'
         
-        try:
-            # Test config loading
-            config_loader = ConfigLoader(config_path)
-            assert config_loader.get('search.location') == 'Karlsruhe'
-            
-            # Test main components initialization
-            with patch('src.scraper.crawler.webdriver.Chrome'):
-                with patch('src.config.database.create_engine'):
-                    with patch('src.config.database.sessionmaker'):
-                        from src.scraper.crawler import KleinanzeigenCrawler
-                        from src.config.database import DatabaseManager
-                        from src.utils.notifications import NotificationManager
-                        
-                        # Initialize components
-                        crawler = KleinanzeigenCrawler(config_loader.get('selenium'))
-                        db_manager = DatabaseManager(config_loader.get('database'))
-                        notifier = NotificationManager({'enabled': False})
-                        
-                        # All components should initialize without errors
-                        assert crawler is not None
-                        assert db_manager is not None
-                        assert notifier is not None
-                        
-        finally:
-            os.unlink(config_path)
+        # Test main components initialization
+        with patch('src.scraper.crawler.webdriver.Chrome'):
+            with patch('src.config.database.create_engine'):
+                with patch('src.config.database.sessionmaker'):
+                    from src.scraper.crawler import KleinanzeigenCrawler
+                    
+                    # Initialize components
+                    crawler = KleinanzeigenCrawler(config_loader.get('selenium'))
+                    db_manager = DatabaseManager(config_loader.get('database'))
+                    notifier = NotificationManager({'enabled': False})
+                    
+                    # All components should initialize without errors
+                    assert crawler is not None
+                    assert db_manager is not None
+                    assert notifier is not None
     
     def test_error_handling_production(self):
         """Test error handling in production-like scenarios"""
-        from src.utils.error_handler import ErrorHandler
-        from src.utils.retry import retry_on_exception, NetworkError
-        
         # Test retry mechanism
         call_count = 0
         
@@ -246,8 +213,6 @@ class TestProductionCrawler:
     
     def test_logging_configuration(self):
         """Test logging configuration"""
-        from src.utils.logger import setup_logger
-        
         log_config = {
             'level': 'INFO',
             'format': '{time} | {level} | {message}',
@@ -261,8 +226,6 @@ class TestProductionCrawler:
     
     def test_scheduler_configuration(self):
         """Test scheduler configuration"""
-        from src.utils.scheduler import TaskScheduler
-        
         scheduler = TaskScheduler()
         
         # Test adding a job
@@ -273,32 +236,19 @@ class TestProductionCrawler:
         
         # Should not raise an exception
         assert scheduler.scheduler is not None
+        
+        # Jobs are dispatched by APScheduler's non-blocking scheduler
+        assert scheduler.scheduler.__class__.__module__.startswith('apscheduler')
+        assert scheduler.scheduler.__class__.__name__ == 'BackgroundScheduler'
     
     @pytest.mark.skipif(os.getenv('SKIP_PERFORMANCE_TESTS') == 'true',
                        reason="Performance tests skipped")
-    def test_performance_basic(self):
+    def test_performance_basic(self, listing_parser):
         """Basic performance test"""
-        from src.scraper.parser import ListingParser
-        
-        # Create a large HTML document
-        large_html = """
-        <html><body>
-        """ + """
-        <article class="aditem">
-            <a href="/s-anzeige/test-book-{i}/123456">
-                <h2 class="text-module-begin">Test Book {i}</h2>
-            </a>
-            <p class="aditem-main--middle--price">Zu verschenken</p>
-            <div class="aditem-main--top--left">76133 Karlsruhe</div>
-        </article>
-        """.format(i=i) * 100 + """
-        </body></html>
-        """
-        
-        parser = ListingParser()
+        large_html = _large_html()
         
         start_time = time.time()
-        results = parser.parse_search_results(large_html)
+        results = listing_parser.parse_search_results(large_html)
         end_time = time.time()
         
         # Should parse 100 listings
@@ -307,16 +257,15 @@ class TestProductionCrawler:
         # Should complete within reasonable time (less than 5 seconds)
         assert (end_time - start_time) < 5.0
     
-    def test_memory_usage_basic(self):
+    @pytest.mark.skipif(sys.platform == 'win32',
+                       reason="resource module not available on Windows")
+    def test_memory_usage_basic(self, listing_parser):
         """Basic memory usage test"""
-        import tracemalloc
-        
-        from src.scraper.parser import ListingParser
+        import resource
         
-        # Start tracing
-        tracemalloc.start()
-        
-        parser = ListingParser()
+        # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+        rss_unit = 1 if sys.platform == 'darwin' else 1024
+        start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
         
         # Create some test data
         for i in range(100):
@@ -327,14 +276,13 @@ class TestProductionCrawler:
                 </article>
             </body></html>
             """
-            parser.parse_search_results(html)
+            listing_parser.parse_search_results(html)
         
-        # Get current memory usage
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        # Peak resident set size growth over the loop
+        end_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
         
         # Memory usage should be reasonable (less than 50MB)
-        assert peak < 50 * 1024 * 1024  # 50MB
+        assert (end_rss - start_rss) * rss_unit < 50 * 1024 * 1024  # 50MB
     
     def teardown_method(self):
         """Cleanup after each test"""
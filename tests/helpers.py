@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Helpers shared by the integration test scripts
+"""
+
+import os
+from pathlib import Path
+
+# Top-level directories that hold the paths the structure checks look for
+PROJECT_DIRS = ('src', 'tests', 'database', 'scripts', 'examples', 'logs')
+
+# Directories never descended into (virtualenvs, caches, tooling)
+_SKIPPED_DIRS = {'__pycache__', 'venv', 'env', 'site-packages', 'node_modules'}
+
+def project_paths(root='.'):
+    """Return the relative paths of root's entries and of everything below PROJECT_DIRS
+    
+    Walking only the project directories keeps a virtualenv in the project
+    root (as README.md suggests) out of the scan.
+    """
+    present = {entry.name for entry in os.scandir(root)}
+    for top in PROJECT_DIRS:
+        for dirpath, dirnames, filenames in os.walk(os.path.join(root, top)):
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith('.') and d not in _SKIPPED_DIRS
+            ]
+            rel_dir = os.path.relpath(dirpath, root)
+            for name in dirnames + filenames:
+                present.add(Path(rel_dir, name).as_posix())
+    return present
@@ -6,16 +6,32 @@ This script performs comprehensive testing of all components
 
 import sys
 import os
+import mmap
 import time
 import tempfile
 import shutil
+import subprocess
 from pathlib import Path
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+def _run_quietly(*args):
+    """Run a Python script with the current interpreter, discarding output"""
+    return subprocess.run(
+        [sys.executable, *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False
+    ).returncode
+
 def run_component_tests():
     """Run basic component tests"""
     print("🔧 Running component tests...")
     
-    exit_code = os.system("python3 test_components.py")
+    from tests.integration import test_components
+    
+    exit_code = test_components.main()
     if exit_code != 0:
         print("❌ Component tests failed")
         return False
@@ -27,7 +43,7 @@ def run_database_tests():
     """Run database tests"""
     print("🗄️ Running database tests...")
     
-    exit_code = os.system("python3 test_database.py")
+    exit_code = _run_quietly('-m', 'pytest', '-q', 'tests/integration/test_database.py')
     if exit_code != 0:
         print("❌ Database tests failed")
         return False
@@ -39,7 +55,7 @@ def run_setup_check():
     """Run setup verification"""
     print("🔍 Running setup check...")
     
-    exit_code = os.system("python3 scripts/check_setup.py")
+    exit_code = subprocess.run([sys.executable, "tools/check_setup.py"], check=False).returncode
     if exit_code != 0:
         print("❌ Setup check failed")
         return False
@@ -53,13 +69,13 @@ def test_cli_help():
     
     try:
         # Test main help
-        exit_code = os.system("python3 main.py --help > /dev/null 2>&1")
+        exit_code = _run_quietly("main.py", "--help")
         if exit_code != 0:
             print("❌ Main help failed")
             return False
         
         # Test version
-        exit_code = os.system("python3 main.py --version > /dev/null 2>&1")
+        exit_code = _run_quietly("main.py", "--version")
         if exit_code != 0:
             print("❌ Version check failed")
             return False
@@ -76,26 +92,33 @@ def test_configuration_loading():
     print("⚙️ Testing configuration loading...")
     
     try:
+        # List each directory once instead of stat-ing every file
+        top = {entry.name for entry in os.scandir('.')}
+        try:
+            examples = {entry.name for entry in os.scandir('examples')}
+        except FileNotFoundError:
+            examples = set()
+        
         # Test with default config
-        if not Path('config.yaml').exists():
+        if 'config.yaml' not in top:
             print("❌ Default config.yaml not found")
             return False
         
         # Test with test config
-        if not Path('config-test.yaml').exists():
+        if 'config-test.yaml' not in top:
             print("❌ Test config not found")
             return False
         
         # Test with example configs
         example_configs = [
-            'examples/config-production.yaml',
-            'examples/config-development.yaml',
-            'examples/config-testing.yaml'
+            'config-production.yaml',
+            'config-development.yaml',
+            'config-testing.yaml'
         ]
         
         for config_file in example_configs:
-            if not Path(config_file).exists():
-                print(f"❌ Example config not found: {config_file}")
+            if config_file not in examples:
+                print(f"❌ Example config not found: examples/{config_file}")
                 return False
         
         print("✅ Configuration files present")
@@ -111,9 +134,9 @@ def test_script_executability():
     
     try:
         scripts = [
-            'scripts/install.sh',
-            'scripts/monitor.py',
-            'scripts/check_setup.py'
+            'tools/install.sh',
+            'tools/monitor.py',
+            'tools/check_setup.py'
         ]
         
         for script in scripts:
@@ -151,8 +174,12 @@ def test_project_structure():
             'examples'
         ]
         
+        from tests.helpers import project_paths
+        
+        present = project_paths()
+        
         for dir_path in required_dirs:
-            if not Path(dir_path).exists():
+            if dir_path not in present:
                 print(f"❌ Required directory missing: {dir_path}")
                 return False
         
@@ -169,7 +196,7 @@ def test_project_structure():
         ]
         
         for file_path in required_files:
-            if not Path(file_path).exists():
+            if file_path not in present:
                 print(f"❌ Required file missing: {file_path}")
                 return False
         
@@ -217,9 +244,9 @@ def test_documentation_completeness():
     print("📚 Testing documentation completeness...")
     
     try:
-        # Check README
-        with open('README.md', 'r') as f:
-            readme_content = f.read()
+        # Check README (memory-mapped, searched without decoding)
+        with open('README.md', 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as readme_content:
             required_sections = [
                 '# Kleinanzeige-Bücherwurm',
                 '## Features',
@@ -229,23 +256,19 @@ def test_documentation_completeness():
             ]
             
             for section in required_sections:
-                if section not in readme_content:
+                if readme_content.find(section.encode('utf-8')) == -1:
                     print(f"❌ README missing section: {section}")
                     return False
         
-        # Check CLAUDE.md
-        with open('CLAUDE.md', 'r') as f:
-            claude_content = f.read()
-            if len(claude_content) < 1000:
-                print("❌ CLAUDE.md too short")
-                return False
+        # Check CLAUDE.md (only its size matters)
+        if os.path.getsize('CLAUDE.md') < 1000:
+            print("❌ CLAUDE.md too short")
+            return False
         
-        # Check DEPLOYMENT.md
-        with open('DEPLOYMENT.md', 'r') as f:
-            deployment_content = f.read()
-            if len(deployment_content) < 1000:
-                print("❌ DEPLOYMENT.md too short")
-                return False
+        # Check DEPLOYMENT.md (only its size matters)
+        if os.path.getsize('DEPLOYMENT.md') < 1000:
+            print("❌ DEPLOYMENT.md too short")
+            return False
         
         print("✅ Documentation is complete")
         return True
@@ -279,8 +302,10 @@ def main():
         try:
             if test_func():
                 passed += 1
+                print(f"✅ {test_name} passed")
             else:
                 failed += 1
+                print(f"❌ {test_name} failed")
         except Exception as e:
             print(f"❌ Test {test_name} crashed: {e}")
             failed += 1
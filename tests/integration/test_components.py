@@ -6,10 +6,45 @@ This script tests individual components without requiring full dependencies
 
 import sys
 import os
+import multiprocessing
+import mmap
+import py_compile
+import re
+import pytest
 import yaml
 import traceback
 from pathlib import Path
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tests.helpers import project_paths
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# First character of any version specifier (==, >=, <=, !=, ~=, <, >)
+_VERSION_SEP = re.compile(r'[=<>!~]')
+
+# Tables and indexes declared in database/schema.sql, as (kind, name)
+_SCHEMA_OBJECT = re.compile(rb'CREATE (TABLE IF NOT EXISTS|INDEX) (\w+)')
+
+PYTHON_FILES = [
+    'main.py',
+    'setup.py',
+    'src/scraper/crawler.py',
+    'src/scraper/parser.py',
+    'src/models/book_listing.py',
+    'src/models/crawl_session.py',
+    'src/config/config_loader.py',
+    'src/config/database.py',
+    'src/utils/logger.py',
+    'src/utils/scheduler.py',
+    'src/utils/notifications.py',
+    'src/utils/retry.py',
+    'src/utils/error_handler.py'
+]
+
 def test_config_loading():
     """Test configuration loading functionality"""
     print("🔧 Testing configuration loading...")
@@ -17,7 +52,7 @@ def test_config_loading():
     try:
         # Test basic YAML loading
         with open('config-test.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAML_LOADER)
         
         print("✓ YAML loading successful")
         
@@ -74,11 +109,8 @@ def test_file_structure():
         'tests/test_config.py'
     ]
     
-    missing_files = []
-    
-    for file_path in required_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    present = project_paths()
+    missing_files = [f for f in required_files if f not in present]
     
     if missing_files:
         print(f"✗ Missing files: {missing_files}")
@@ -87,38 +119,34 @@ def test_file_structure():
         print("✓ All required files present")
         return True
 
-def test_syntax_validation():
-    """Test Python syntax validation"""
+def _compile_one(file_path):
+    """Compile a single file, returning (path, syntax error, read error)"""
+    try:
+        py_compile.compile(file_path, doraise=True)
+        return file_path, None, None
+    except py_compile.PyCompileError as e:
+        return file_path, e.msg, None
+    except Exception as e:
+        return file_path, None, str(e)
+
+def check_syntax():
+    """Compile every file in PYTHON_FILES, reporting all results at once"""
     print("\n🐍 Testing Python syntax validation...")
     
-    python_files = [
-        'main.py',
-        'setup.py',
-        'src/scraper/crawler.py',
-        'src/scraper/parser.py',
-        'src/models/book_listing.py',
-        'src/models/crawl_session.py',
-        'src/config/config_loader.py',
-        'src/config/database.py',
-        'src/utils/logger.py',
-        'src/utils/scheduler.py',
-        'src/utils/notifications.py',
-        'src/utils/retry.py',
-        'src/utils/error_handler.py'
-    ]
-    
     syntax_errors = []
     
-    for file_path in python_files:
-        try:
-            with open(file_path, 'r') as f:
-                compile(f.read(), file_path, 'exec')
+    # Files are independent, so compile them across worker processes
+    with multiprocessing.Pool(processes=min(len(PYTHON_FILES), os.cpu_count() or 1)) as pool:
+        results = pool.map(_compile_one, PYTHON_FILES)
+    
+    for file_path, syntax_error, read_error in results:
+        if syntax_error:
+            syntax_errors.append(f"{file_path}: {syntax_error}")
+            print(f"✗ {file_path} - syntax error: {syntax_error}")
+        elif read_error:
+            print(f"⚠ {file_path} - could not read: {read_error}")
+        else:
             print(f"✓ {file_path} - syntax OK")
-        except SyntaxError as e:
-            syntax_errors.append(f"{file_path}: {e}")
-            print(f"✗ {file_path} - syntax error: {e}")
-        except Exception as e:
-            print(f"⚠ {file_path} - could not read: {e}")
     
     if syntax_errors:
         print(f"\n✗ Syntax errors found: {len(syntax_errors)}")
@@ -127,6 +155,11 @@ def test_syntax_validation():
         print("\n✓ All Python files have valid syntax")
         return True
 
+@pytest.mark.parametrize('file_path', PYTHON_FILES)
+def test_syntax_validation(file_path):
+    """Test Python syntax validation, one collected test per file"""
+    py_compile.compile(file_path, doraise=True)
+
 def test_requirements():
     """Test requirements.txt structure"""
     print("\n📦 Testing requirements.txt...")
@@ -152,7 +185,7 @@ def test_requirements():
         found_packages = []
         for req in requirements:
             if req.strip() and not req.startswith('#'):
-                package_name = req.split('==')[0].split('>=')[0].split('<=')[0]
+                package_name = _VERSION_SEP.split(req.strip(), 1)[0]
                 found_packages.append(package_name)
         
         missing = []
@@ -176,22 +209,20 @@ def test_database_schema():
     print("\n🗄️ Testing database schema...")
     
     try:
-        with open('database/schema.sql', 'r') as f:
-            schema = f.read()
+        # Collect every created table and index name in one pass over the file
+        with open('database/schema.sql', 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as schema:
+            created = _SCHEMA_OBJECT.findall(schema)
+        
+        tables = {name.decode() for kind, name in created if kind == b'TABLE IF NOT EXISTS'}
+        indexes = {name.decode() for kind, name in created if kind == b'INDEX'}
         
         # Check for required tables
         required_tables = ['crawl_sessions', 'book_listings']
         required_indexes = ['idx_listing_id', 'idx_is_active']
         
-        missing_tables = []
-        for table in required_tables:
-            if f'CREATE TABLE IF NOT EXISTS {table}' not in schema:
-                missing_tables.append(table)
-        
-        missing_indexes = []
-        for index in required_indexes:
-            if f'CREATE INDEX {index}' not in schema:
-                missing_indexes.append(index)
+        missing_tables = sorted(set(required_tables) - tables)
+        missing_indexes = sorted(set(required_indexes) - indexes)
         
         if missing_tables:
             print(f"✗ Missing tables in schema: {missing_tables}")
@@ -250,7 +281,7 @@ def main():
     tests = [
         test_config_loading,
         test_file_structure,
-        test_syntax_validation,
+        check_syntax,
         test_requirements,
         test_database_schema,
         test_environment_template
@@ -1,204 +1,118 @@
 #!/usr/bin/env python3
 """
-Database connection test script
-This script tests database connectivity and operations
+Database connection tests
+These tests check database configuration, models and schema without a running database
 """
 
 import sys
-import os
+import re
+import functools
+import warnings
 from pathlib import Path
+import pytest
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-def test_database_connection():
-    """Test database connection without requiring actual database"""
-    print("🗄️ Testing database connection logic...")
+CONFIG_PATH = Path(__file__).resolve().parent.parent / 'config-test.yaml'
+
+# Table, index and foreign key statements checked in the schema
+_SCHEMA_STATEMENTS = re.compile(
+    r'CREATE (?:TABLE IF NOT EXISTS|INDEX) \w+|REFERENCES crawl_sessions\(id\)'
+)
+
+@functools.lru_cache(maxsize=1)
+def _schema_text():
+    """Read database/schema.sql once per process"""
+    return Path('database/schema.sql').read_text()
+
+@pytest.fixture(scope="module", autouse=True)
+def db_env():
+    """Provide database credentials through the environment for the whole module"""
+    test_env = {
+        'DB_HOST': 'localhost',
+        'DB_NAME': 'test_db',
+        'DB_USER': 'test_user',
+        'DB_PASSWORD': 'test_password'
+    }
     
-    try:
-        # Test environment variables
-        test_env = {
-            'DB_HOST': 'localhost',
-            'DB_NAME': 'test_db',
-            'DB_USER': 'test_user',
-            'DB_PASSWORD': 'test_password'
-        }
-        
-        # Temporarily set environment variables
+    with pytest.MonkeyPatch.context() as mp:
         for key, value in test_env.items():
-            os.environ[key] = value
-        
-        # Test config loading with database settings
-        from src.config.config_loader import ConfigLoader
-        
-        config = ConfigLoader('config-test.yaml')
-        db_config = config.get('database', {})
-        
-        # Validate database configuration
-        required_keys = ['host', 'name', 'user', 'password']
-        missing_keys = [key for key in required_keys if not db_config.get(key)]
-        
-        if missing_keys:
-            print(f"✗ Missing database configuration keys: {missing_keys}")
-            return False
-        
-        print("✓ Database configuration validation passed")
-        
-        # Test database manager initialization (without actual connection)
-        try:
-            from src.config.database import DatabaseManager
-            
-            # This will fail if PostgreSQL is not installed, but that's expected
-            print("✓ DatabaseManager class can be imported")
-            
-        except ImportError as e:
-            print(f"✗ DatabaseManager import failed: {e}")
-            return False
-        
-        # Clean up environment variables
-        for key in test_env:
-            os.environ.pop(key, None)
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Database connection test failed: {e}")
-        return False
+            mp.setenv(key, value)
+        yield test_env
 
-def test_model_definitions():
-    """Test SQLAlchemy model definitions"""
-    print("\n📊 Testing model definitions...")
+@pytest.fixture(scope="module")
+def db_config(db_env):
+    """Database section of the test configuration, loaded once"""
+    if not CONFIG_PATH.exists():
+        pytest.skip(f"{CONFIG_PATH} not found")
+    
+    from src.config.config_loader import ConfigLoader
     
-    try:
-        from src.models import BookListing, CrawlSession, Base
-        
-        # Test BookListing model
-        print("✓ BookListing model imported successfully")
-        
-        # Test CrawlSession model
-        print("✓ CrawlSession model imported successfully")
-        
-        # Test Base model
-        print("✓ Base model imported successfully")
-        
-        # Test model attributes
-        listing_attrs = [
-            'id', 'listing_id', 'title', 'description', 'price',
-            'location', 'seller_name', 'listing_url', 'created_at'
-        ]
-        
-        for attr in listing_attrs:
-            if not hasattr(BookListing, attr):
-                print(f"✗ BookListing missing attribute: {attr}")
-                return False
-        
-        print("✓ BookListing model attributes validated")
-        
-        session_attrs = [
-            'id', 'session_id', 'start_time', 'end_time', 'status',
-            'total_listings_found', 'new_listings_found'
-        ]
-        
-        for attr in session_attrs:
-            if not hasattr(CrawlSession, attr):
-                print(f"✗ CrawlSession missing attribute: {attr}")
-                return False
-        
-        print("✓ CrawlSession model attributes validated")
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ Model definition test failed: {e}")
-        return False
+    return ConfigLoader(str(CONFIG_PATH)).get('database', {})
 
-def test_sql_schema():
-    """Test SQL schema file"""
-    print("\n📝 Testing SQL schema...")
+@pytest.fixture(scope="module")
+def schema_statements():
+    """Every checked statement in the schema, collected in a single pass"""
+    return set(_SCHEMA_STATEMENTS.findall(_schema_text()))
+
+def test_database_connection(db_config):
+    """Test database connection logic without requiring actual database"""
+    # Validate database configuration
+    required_keys = ['host', 'name', 'user', 'password']
+    missing_keys = [key for key in required_keys if not db_config.get(key)]
+    
+    assert not missing_keys, f"Missing database configuration keys: {missing_keys}"
     
-    try:
-        with open('database/schema.sql', 'r') as f:
-            schema = f.read()
-        
-        # Test for required tables
-        required_tables = [
-            'CREATE TABLE IF NOT EXISTS crawl_sessions',
-            'CREATE TABLE IF NOT EXISTS book_listings'
-        ]
-        
-        missing_tables = []
-        for table_sql in required_tables:
-            if table_sql not in schema:
-                missing_tables.append(table_sql)
-        
-        if missing_tables:
-            print(f"✗ Missing table definitions: {missing_tables}")
-            return False
-        
-        print("✓ Required tables found in schema")
-        
-        # Test for indexes
-        required_indexes = [
-            'CREATE INDEX idx_listing_id',
-            'CREATE INDEX idx_is_active'
-        ]
-        
-        missing_indexes = []
-        for index_sql in required_indexes:
-            if index_sql not in schema:
-                missing_indexes.append(index_sql)
-        
-        if missing_indexes:
-            print(f"⚠ Missing indexes (performance may be affected): {missing_indexes}")
-        else:
-            print("✓ Required indexes found in schema")
-        
-        # Test for foreign keys
-        if 'REFERENCES crawl_sessions(id)' not in schema:
-            print("⚠ Foreign key relationship not found")
-        else:
-            print("✓ Foreign key relationships found")
-        
-        return True
-        
-    except Exception as e:
-        print(f"✗ SQL schema test failed: {e}")
-        return False
+    # Test database manager initialization (without actual connection)
+    from src.config.database import DatabaseManager
+    
+    assert DatabaseManager is not None
 
-def main():
-    """Run all database tests"""
-    print("🚀 Kleinanzeigen Crawler - Database Testing")
-    print("=" * 50)
+def test_model_definitions():
+    """Test SQLAlchemy model definitions"""
+    from src.models import BookListing, CrawlSession, Base
     
-    tests = [
-        test_database_connection,
-        test_model_definitions,
-        test_sql_schema
-    ]
+    assert Base is not None
     
-    passed = 0
-    failed = 0
+    # Test model attributes
+    listing_attrs = [
+        'id', 'listing_id', 'title', 'description', 'price',
+        'location', 'seller_name', 'listing_url', 'created_at'
+    ]
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"✗ Test {test.__name__} crashed: {e}")
-            failed += 1
+    missing = set(listing_attrs).difference(dir(BookListing))
+    assert not missing, f"BookListing missing attributes: {sorted(missing)}"
     
-    print("\n" + "=" * 50)
-    print(f"📊 Database Test Results: {passed} passed, {failed} failed")
+    session_attrs = [
+        'id', 'session_id', 'start_time', 'end_time', 'status',
+        'total_listings_found', 'new_listings_found'
+    ]
     
-    if failed == 0:
-        print("🎉 All database tests passed!")
-        print("\nNote: Actual database connection requires PostgreSQL and proper credentials")
-        return 0
-    else:
-        print("❌ Some tests failed. Please check the issues above.")
-        return 1
+    missing = set(session_attrs).difference(dir(CrawlSession))
+    assert not missing, f"CrawlSession missing attributes: {sorted(missing)}"
 
-if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+def test_sql_schema(schema_statements):
+    """Test SQL schema file"""
+    # Test for required tables
+    required_tables = [
+        'CREATE TABLE IF NOT EXISTS crawl_sessions',
+        'CREATE TABLE IF NOT EXISTS book_listings'
+    ]
+    
+    missing_tables = [table_sql for table_sql in required_tables if table_sql not in schema_statements]
+    assert not missing_tables, f"Missing table definitions: {missing_tables}"
+    
+    # Test for indexes
+    required_indexes = [
+        'CREATE INDEX idx_listing_id',
+        'CREATE INDEX idx_is_active'
+    ]
+    
+    missing_indexes = [index_sql for index_sql in required_indexes if index_sql not in schema_statements]
+    if missing_indexes:
+        warnings.warn(f"Missing indexes (performance may be affected): {missing_indexes}")
+    
+    # Test for foreign keys
+    if 'REFERENCES crawl_sessions(id)' not in schema_statements:
+        warnings.warn("Foreign key relationship not found")
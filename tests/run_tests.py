@@ -7,88 +7,84 @@ This script provides an easy way to run different types of tests
 import sys
 import os
 import argparse
-import subprocess
+import importlib.util
+from contextlib import contextmanager
 from pathlib import Path
 
-def run_unit_tests(verbose=False):
-    """Run unit tests"""
-    print("🧪 Running unit tests...")
-    cmd = ["python3", "-m", "pytest", "tests/unit/", "-v" if verbose else "-q"]
-    return subprocess.run(cmd).returncode == 0
+# Test paths collected for each suite flag
+SUITE_PATHS = {
+    'unit': ["tests/unit/"],
+    'integration': ["tests/integration/"],
+    'functional': ["tests/functional/"],
+    'all': ["tests/"],
+    'quick': ["tests/"],
+    'production': ["tests/functional/"],
+    'coverage': ["tests/"],
+}
 
-def run_integration_tests(verbose=False):
-    """Run integration tests"""
-    print("🔗 Running integration tests...")
-    cmd = ["python3", "-m", "pytest", "tests/integration/", "-v" if verbose else "-q"]
-    return subprocess.run(cmd).returncode == 0
+# Extra pytest arguments added by suite flags
+SUITE_ARGS = {
+    'quick': ["-m", "not slow"],  # Exclude slow tests
+    'coverage': ["--cov=src", "--cov-report=html", "--cov-report=term"],
+}
 
-def run_functional_tests(verbose=False):
-    """Run functional tests"""
-    print("⚙️ Running functional tests...")
-    cmd = ["python3", "-m", "pytest", "tests/functional/", "-v" if verbose else "-q"]
-    return subprocess.run(cmd).returncode == 0
+# Environment for production testing
+PRODUCTION_ENV = {
+    'SKIP_SELENIUM_TESTS': 'false',
+    'SKIP_NETWORK_TESTS': 'true',  # Skip network tests in production
+    'SKIP_DATABASE_TESTS': 'true'  # Skip database tests in production
+}
 
-def run_all_tests(verbose=False):
-    """Run all tests"""
-    print("🚀 Running all tests...")
-    cmd = ["python3", "-m", "pytest", "tests/", "-v" if verbose else "-q"]
-    return subprocess.run(cmd).returncode == 0
+@contextmanager
+def _envset(**variables):
+    """Temporarily set environment variables, restoring previous values on exit"""
+    saved = {key: os.environ.get(key) for key in variables}
+    os.environ.update(variables)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
 
-def run_quick_tests(verbose=False):
-    """Run quick tests (excluding slow ones)"""
-    print("⚡ Running quick tests...")
-    cmd = ["python3", "-m", "pytest", "tests/", "-m", "not slow", "-v" if verbose else "-q"]
-    return subprocess.run(cmd).returncode == 0
-
-def run_production_tests(verbose=False):
-    """Run production-ready tests"""
-    print("🏭 Running production tests...")
-    
-    # Set environment variables for production testing
-    env = os.environ.copy()
-    env['SKIP_SELENIUM_TESTS'] = 'false'
-    env['SKIP_NETWORK_TESTS'] = 'true'  # Skip network tests in production
-    env['SKIP_DATABASE_TESTS'] = 'true'  # Skip database tests in production
-    
-    cmd = ["python3", "-m", "pytest", "tests/functional/", "-v" if verbose else "-q"]
-    return subprocess.run(cmd, env=env).returncode == 0
+def _run(paths, extra_args=(), verbose=False, env=None):
+    """Run pytest in this process on the given paths, optionally with extra env vars"""
+    import pytest
+    
+    args = list(paths) + list(extra_args) + ["-v" if verbose else "-q"]
+    
+    with _envset(**(env or {})):
+        return pytest.main(args) == 0
 
-def run_coverage_tests(verbose=False):
-    """Run tests with coverage reporting"""
-    print("📊 Running tests with coverage...")
-    cmd = [
-        "python3", "-m", "pytest",
-        "tests/",
-        "--cov=src",
-        "--cov-report=html",
-        "--cov-report=term",
-        "-v" if verbose else "-q"
+def _dedupe_paths(paths):
+    """Drop repeated paths and any path already covered by a requested parent directory"""
+    unique = list(dict.fromkeys(Path(path) for path in paths))
+    return [
+        str(path) for path in unique
+        if not any(other != path and other in path.parents for other in unique)
     ]
-    return subprocess.run(cmd).returncode == 0
-
-def run_specific_test(test_path, verbose=False):
-    """Run a specific test file or function"""
-    print(f"🎯 Running specific test: {test_path}")
-    cmd = ["python3", "-m", "pytest", test_path, "-v" if verbose else "-q"]
-    return subprocess.run(cmd).returncode == 0
 
 def check_test_requirements():
     """Check if test requirements are met"""
     print("🔍 Checking test requirements...")
     
-    required_packages = [
-        'pytest',
-        'pytest-cov',
-        'pytest-mock'
-    ]
+    # Distribution name -> importable module name
+    required_packages = {
+        'pytest': 'pytest',
+        'pytest-cov': 'pytest_cov',
+        'pytest-mock': 'pytest_mock',
+        'pytest-xdist': 'xdist'
+    }
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
+    for package, module in required_packages.items():
+        # Locate the module without executing it
+        if importlib.util.find_spec(module) is not None:
             print(f"✅ {package} is available")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"❌ {package} is missing")
     
@@ -114,6 +110,8 @@ Examples:
   python3 tests/run_tests.py --quick             # Run quick tests
   python3 tests/run_tests.py --production        # Run production tests
   python3 tests/run_tests.py --coverage          # Run with coverage
+  python3 tests/run_tests.py --all --jobs 4      # Run all tests on 4 workers
+  python3 tests/run_tests.py --unit --fast       # Re-run only last failed unit tests
   python3 tests/run_tests.py --test tests/unit/test_parser.py  # Run specific test
         """
     )
@@ -128,6 +126,9 @@ Examples:
     parser.add_argument('--test', help='Run specific test file or function')
     parser.add_argument('--check', action='store_true', help='Check test requirements')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--fast', action='store_true', help='Re-run only last failed tests (all if none failed)')
+    parser.add_argument('--jobs', '-n', default='auto',
+                        help='Number of parallel workers when pytest-xdist is installed (default: auto)')
     
     args = parser.parse_args()
     
@@ -144,31 +145,28 @@ Examples:
                args.quick, args.production, args.coverage, args.test]):
         args.quick = True
     
-    success = True
-    
-    if args.unit:
-        success &= run_unit_tests(args.verbose)
-    
-    if args.integration:
-        success &= run_integration_tests(args.verbose)
-    
-    if args.functional:
-        success &= run_functional_tests(args.verbose)
+    # Collect every requested suite into a single pytest invocation
+    suites = [name for name in SUITE_PATHS if getattr(args, name)]
+    paths = [path for name in suites for path in SUITE_PATHS[name]]
+    if args.test:
+        paths.append(args.test)
     
-    if args.all:
-        success &= run_all_tests(args.verbose)
+    extra_args = [arg for name in suites for arg in SUITE_ARGS.get(name, [])]
+    env = PRODUCTION_ENV if args.production else None
     
-    if args.quick:
-        success &= run_quick_tests(args.verbose)
+    # Report the slowest tests so they can be targeted for optimization
+    extra_args.append("--durations=10")
     
-    if args.production:
-        success &= run_production_tests(args.verbose)
+    # Use pytest's cache to run previously failed tests only, and first
+    if args.fast:
+        extra_args += ["--lf", "--ff"]
     
-    if args.coverage:
-        success &= run_coverage_tests(args.verbose)
+    # Spread tests over workers when pytest-xdist is available
+    if importlib.util.find_spec('xdist') is not None:
+        extra_args += ["-n", args.jobs]
     
-    if args.test:
-        success &= run_specific_test(args.test, args.verbose)
+    print(f"🚀 Running {', '.join(suites + (['specific'] if args.test else []))} tests...")
+    success = _run(_dedupe_paths(paths), extra_args, args.verbose, env)
     
     if success:
         print("\n✅ All tests passed!")
@@ -1,66 +1,56 @@
+import textwrap
 import pytest
-import os
-import tempfile
 from src.config.config_loader import ConfigLoader
 
+DB_CFG = textwrap.dedent("""
+    database:
+      host: "${DB_HOST}"
+      port: 5432
+      name: "${DB_NAME}"
+""")
+
+SEARCH_CFG = textwrap.dedent("""
+    search:
+      location: "Karlsruhe"
+      radius_km: 20
+      keywords:
+        - "sammlung"
+        - "konvolut"
+""")
+
+@pytest.fixture(scope="module")
+def db_config_loader(tmp_path_factory):
+    """ConfigLoader for a database config using env vars, built once per module"""
+    config_path = tmp_path_factory.mktemp("config") / "database.yaml"
+    config_path.write_text(DB_CFG)
+    
+    with pytest.MonkeyPatch.context() as mp:
+        # Set environment variables
+        mp.setenv('DB_HOST', 'localhost')
+        mp.setenv('DB_NAME', 'testdb')
+        
+        yield ConfigLoader(str(config_path))
+
+@pytest.fixture(scope="module")
+def search_config_loader(tmp_path_factory):
+    """ConfigLoader for a nested search config, built once per module"""
+    config_path = tmp_path_factory.mktemp("config") / "search.yaml"
+    config_path.write_text(SEARCH_CFG)
+    
+    return ConfigLoader(str(config_path))
+
 class TestConfigLoader:
     """Test cases for the ConfigLoader class"""
     
-    def test_load_config_with_env_vars(self):
+    def test_load_config_with_env_vars(self, db_config_loader):
         """Test loading config with environment variables"""
-        # Create a temporary config file
-        config_content = """
-        database:
-          host: "${DB_HOST}"
-          port: 5432
-          name: "${DB_NAME}"
-        """
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(config_content)
-            config_path = f.name
-        
-        try:
-            # Set environment variables
-            os.environ['DB_HOST'] = 'localhost'
-            os.environ['DB_NAME'] = 'testdb'
-            
-            # Load config
-            config_loader = ConfigLoader(config_path)
-            
-            # Test values
-            assert config_loader.get('database.host') == 'localhost'
-            assert config_loader.get('database.name') == 'testdb'
-            assert config_loader.get('database.port') == 5432
-            
-        finally:
-            # Cleanup
-            os.unlink(config_path)
-            os.environ.pop('DB_HOST', None)
-            os.environ.pop('DB_NAME', None)
+        assert db_config_loader.get('database.host') == 'localhost'
+        assert db_config_loader.get('database.name') == 'testdb'
+        assert db_config_loader.get('database.port') == 5432
     
-    def test_get_nested_config(self):
+    def test_get_nested_config(self, search_config_loader):
         """Test getting nested configuration values"""
-        config_content = """
-        search:
-          location: "Karlsruhe"
-          radius_km: 20
-          keywords:
-            - "sammlung"
-            - "konvolut"
-        """
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(config_content)
-            config_path = f.name
-        
-        try:
-            config_loader = ConfigLoader(config_path)
-            
-            assert config_loader.get('search.location') == 'Karlsruhe'
-            assert config_loader.get('search.radius_km') == 20
-            assert config_loader.get('search.keywords') == ['sammlung', 'konvolut']
-            assert config_loader.get('nonexistent.key', 'default') == 'default'
-            
-        finally:
-            os.unlink(config_path)
\ No newline at end of file
+        assert search_config_loader.get('search.location') == 'Karlsruhe'
+        assert search_config_loader.get('search.radius_km') == 20
+        assert search_config_loader.get('search.keywords') == ['sammlung', 'konvolut']
+        assert search_config_loader.get('nonexistent.key', 'default') == 'default'
@@ -1,69 +1,64 @@
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from selenium.common.exceptions import NoSuchWindowException, StaleElementReferenceException
 from src.utils.error_handler import ErrorHandler
 
+@pytest.fixture
+def mock_logger(mocker):
+    """Replace the error handler's logger for the duration of a test"""
+    return mocker.patch('src.utils.error_handler.logger')
+
+def _error_log(mock):
+    """Render every logged error call into one string for substring checks"""
+    return "\n".join(map(str, mock.error.call_args_list))
+
+def _logged(mock, needle):
+    """Check whether any logged error mentions the given text"""
+    return needle in _error_log(mock)
+
 class TestErrorHandler:
     """Test cases for the ErrorHandler class"""
     
-    def test_log_exception_basic(self):
+    def test_log_exception_basic(self, mock_logger):
         """Test basic exception logging"""
         error = ValueError("Test error")
         
-        with patch('src.utils.error_handler.logger') as mock_logger:
-            ErrorHandler.log_exception(error)
-            
-            mock_logger.error.assert_called()
-            # Check that error type and message are logged
-            args = mock_logger.error.call_args_list
-            assert any("ValueError" in str(call) for call in args)
-            assert any("Test error" in str(call) for call in args)
+        ErrorHandler.log_exception(error)
+        
+        mock_logger.error.assert_called()
+        # Check that error type and message are logged
+        log = _error_log(mock_logger)
+        assert "ValueError" in log
+        assert "Test error" in log
     
-    def test_log_exception_with_context(self):
+    def test_log_exception_with_context(self, mock_logger):
         """Test exception logging with context"""
         error = ValueError("Test error")
         context = {"url": "https://example.com", "attempt": 1}
         
-        with patch('src.utils.error_handler.logger') as mock_logger:
-            ErrorHandler.log_exception(error, context)
-            
-            mock_logger.error.assert_called()
-            # Check that context is logged
-            args = mock_logger.error.call_args_list
-            assert any("url" in str(call) for call in args)
-    
-    def test_handle_selenium_error_stale_element(self):
-        """Test handling of stale element reference error"""
-        from selenium.common.exceptions import StaleElementReferenceException
-        
-        error = StaleElementReferenceException("Element is stale")
-        result = ErrorHandler.handle_selenium_error(error)
+        ErrorHandler.log_exception(error, context)
         
-        assert result is True  # Should be recoverable
+        mock_logger.error.assert_called()
+        # Check that context is logged
+        assert _logged(mock_logger, "url")
     
-    def test_handle_selenium_error_no_window(self):
-        """Test handling of no window error"""
-        from selenium.common.exceptions import NoSuchWindowException
+    @pytest.mark.parametrize("exc_cls,message,recoverable", [
+        (StaleElementReferenceException, "Element is stale", True),
+        (NoSuchWindowException, "Window not found", False),
+    ])
+    def test_handle_selenium_error(self, exc_cls, message, recoverable):
+        """Test which selenium errors are treated as recoverable"""
+        result = ErrorHandler.handle_selenium_error(exc_cls(message))
         
-        error = NoSuchWindowException("Window not found")
-        result = ErrorHandler.handle_selenium_error(error)
-        
-        assert result is False  # Should not be recoverable
-    
-    def test_handle_network_error_connection(self):
-        """Test handling of connection errors"""
-        import requests
-        
-        error = requests.exceptions.ConnectionError("Connection failed")
-        result = ErrorHandler.handle_network_error(error)
-        
-        assert result is True  # Should be recoverable
+        assert result is recoverable
     
-    def test_handle_network_error_timeout(self):
-        """Test handling of timeout errors"""
-        import requests
-        
-        error = requests.exceptions.Timeout("Request timeout")
-        result = ErrorHandler.handle_network_error(error)
+    @pytest.mark.parametrize("exc_cls,message", [
+        (requests.exceptions.ConnectionError, "Connection failed"),
+        (requests.exceptions.Timeout, "Request timeout"),
+    ])
+    def test_handle_network_error(self, exc_cls, message):
+        """Test that connection and timeout errors are recoverable"""
+        result = ErrorHandler.handle_network_error(exc_cls(message))
         
         assert result is True  # Should be recoverable
     
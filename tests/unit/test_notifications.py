@@ -1,28 +1,57 @@
+import copy
+import re
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from src.utils.notifications import NotificationManager
 
+NOTIFICATION_CONFIG = {
+    'enabled': True,
+    'email': {
+        'smtp_server': 'smtp.test.com',
+        'smtp_port': 587,
+        'sender': 'test@test.com',
+        'password': 'test_password',
+        'recipients': ['recipient@test.com']
+    }
+}
+
+# Strings the rendered listing HTML must contain, matched in one scan
+HTML_EXPECTED = [
+    'Test Book',
+    'Test Description',
+    'Test Location',
+    'Zu verschenken',
+    'https://example.com/1',
+    'https://example.com/thumb.jpg',
+    'DOCTYPE html'
+]
+HTML_NEEDLES = re.compile('|'.join(map(re.escape, HTML_EXPECTED)))
+
+@pytest.fixture
+def smtp_mock(mocker):
+    """Patch smtplib.SMTP and return (class mock, connection used inside the with block)"""
+    smtp_class = mocker.patch('src.utils.notifications.smtplib.SMTP')
+    smtp = MagicMock()
+    smtp_class.return_value.__enter__.return_value = smtp
+    return smtp_class, smtp
+
 class TestNotificationManager:
     """Test cases for the NotificationManager class"""
     
-    def setup_method(self):
-        """Setup test configuration"""
-        self.config = {
-            'enabled': True,
-            'email': {
-                'smtp_server': 'smtp.test.com',
-                'smtp_port': 587,
-                'sender': 'test@test.com',
-                'password': 'test_password',
-                'recipients': ['recipient@test.com']
-            }
-        }
-        self.manager = NotificationManager(self.config)
+    @pytest.fixture
+    def manager(self):
+        """Fresh manager for tests that send or patch notifications"""
+        return NotificationManager(copy.deepcopy(NOTIFICATION_CONFIG))
     
-    def test_init_enabled(self):
+    @pytest.fixture(scope="class")
+    def shared_manager(self):
+        """One manager shared by the read-only tests in the class"""
+        return NotificationManager(copy.deepcopy(NOTIFICATION_CONFIG))
+    
+    def test_init_enabled(self, shared_manager):
         """Test initialization with notifications enabled"""
-        assert self.manager.enabled is True
-        assert self.manager.config == self.config
+        assert shared_manager.enabled is True
+        assert shared_manager.config == NOTIFICATION_CONFIG
     
     def test_init_disabled(self):
         """Test initialization with notifications disabled"""
@@ -30,33 +59,31 @@ class TestNotificationManager:
         manager = NotificationManager(config)
         assert manager.enabled is False
     
-    @patch('src.utils.notifications.smtplib.SMTP')
-    def test_send_email_success(self, mock_smtp_class):
+    def test_send_email_success(self, smtp_mock, manager):
         """Test successful email sending"""
-        mock_smtp = MagicMock()
-        mock_smtp_class.return_value.__enter__.return_value = mock_smtp
+        _, mock_smtp = smtp_mock
         
         subject = "Test Subject"
         body = "Test Body"
         recipients = ["test@example.com"]
         
-        self.manager.send_email(subject, body, recipients)
+        manager.send_email(subject, body, recipients)
         
         mock_smtp.starttls.assert_called_once()
         mock_smtp.login.assert_called_once_with('test@test.com', 'test_password')
         mock_smtp.send_message.assert_called_once()
     
-    @patch('src.utils.notifications.smtplib.SMTP')
     @patch('src.utils.notifications.logger')
-    def test_send_email_failure(self, mock_logger, mock_smtp_class):
+    def test_send_email_failure(self, mock_logger, smtp_mock, manager):
         """Test email sending failure"""
+        mock_smtp_class, _ = smtp_mock
         mock_smtp_class.side_effect = Exception("SMTP error")
         
         subject = "Test Subject"
         body = "Test Body"
         recipients = ["test@example.com"]
         
-        self.manager.send_email(subject, body, recipients)
+        manager.send_email(subject, body, recipients)
         
         mock_logger.error.assert_called_once()
     
@@ -74,7 +101,7 @@ class TestNotificationManager:
         mock_logger.info.assert_called_once_with("Notifications disabled, skipping email")
     
     @patch.object(NotificationManager, 'send_email')
-    def test_notify_new_listings(self, mock_send_email):
+    def test_notify_new_listings(self, mock_send_email, manager):
         """Test notifying about new listings"""
         listings = [
             {
@@ -91,7 +118,7 @@ class TestNotificationManager:
             }
         ]
         
-        self.manager.notify_new_listings(listings)
+        manager.notify_new_listings(listings)
         
         mock_send_email.assert_called_once()
         args, kwargs = mock_send_email.call_args
@@ -101,13 +128,13 @@ class TestNotificationManager:
         assert recipients == ['recipient@test.com']
     
     @patch.object(NotificationManager, 'send_email')
-    def test_notify_new_listings_empty(self, mock_send_email):
+    def test_notify_new_listings_empty(self, mock_send_email, manager):
         """Test notifying with empty listings"""
-        self.manager.notify_new_listings([])
+        manager.notify_new_listings([])
         
         mock_send_email.assert_not_called()
     
-    def test_create_listing_html(self):
+    def test_create_listing_html(self, shared_manager):
         """Test HTML creation for listings"""
         listings = [
             {
@@ -120,17 +147,12 @@ class TestNotificationManager:
             }
         ]
         
-        html = self.manager._create_listing_html(listings)
+        html = shared_manager._create_listing_html(listings)
         
-        assert 'Test Book' in html
-        assert 'Test Description' in html
-        assert 'Test Location' in html
-        assert 'Zu verschenken' in html
-        assert 'https://example.com/1' in html
-        assert 'https://example.com/thumb.jpg' in html
-        assert 'DOCTYPE html' in html
+        missing = set(HTML_EXPECTED) - set(HTML_NEEDLES.findall(html))
+        assert not missing
     
-    def test_create_listing_html_no_image(self):
+    def test_create_listing_html_no_image(self, shared_manager):
         """Test HTML creation for listings without images"""
         listings = [
             {
@@ -143,12 +165,12 @@ class TestNotificationManager:
             }
         ]
         
-        html = self.manager._create_listing_html(listings)
+        html = shared_manager._create_listing_html(listings)
         
         assert 'Test Book' in html
         assert '<img src=' not in html  # No image tag should be present
     
-    def test_create_listing_html_with_price(self):
+    def test_create_listing_html_with_price(self, shared_manager):
         """Test HTML creation for listings with price"""
         listings = [
             {
@@ -160,7 +182,7 @@ class TestNotificationManager:
             }
         ]
         
-        html = self.manager._create_listing_html(listings)
+        html = shared_manager._create_listing_html(listings)
         
         assert '15.99 €' in html
         assert 'Zu verschenken' not in html
\ No newline at end of file
@@ -4,36 +4,56 @@ from src.scraper.parser import ListingParser
 class TestListingParser:
     """Test cases for the ListingParser class"""
     
-    def setup_method(self):
-        self.parser = ListingParser()
+    @pytest.fixture(scope="class")
+    def parser(self):
+        """One parser shared by every test in the class"""
+        return ListingParser()
     
-    def test_clean_price_free_items(self):
-        """Test price cleaning for free items"""
-        assert self.parser.clean_price("Zu verschenken") == 0.0
-        assert self.parser.clean_price("Gratis") == 0.0
-        assert self.parser.clean_price("Kostenlos") == 0.0
-        assert self.parser.clean_price("Free") == 0.0
+    @pytest.mark.parametrize("raw,expected", [
+        # Free items
+        ("Zu verschenken", 0.0),
+        ("Gratis", 0.0),
+        ("Kostenlos", 0.0),
+        ("Free", 0.0),
+        # Numeric values
+        ("10 €", 10.0),
+        ("5,50 EUR", 5.5),
+        ("100 VB", 100.0),
+        ("15,99 Festpreis", 15.99),
+        # Edge cases
+        ("", 0.0),
+        (None, 0.0),
+        ("Kein Preis", 0.0),
+    ])
+    def test_clean_price(self, parser, raw, expected):
+        """Test price cleaning for free, numeric and edge-case values"""
+        assert parser.clean_price(raw) == expected
     
-    def test_clean_price_numeric(self):
-        """Test price cleaning for numeric values"""
-        assert self.parser.clean_price("10 €") == 10.0
-        assert self.parser.clean_price("5,50 EUR") == 5.5
-        assert self.parser.clean_price("100 VB") == 100.0
-        assert self.parser.clean_price("15,99 Festpreis") == 15.99
-    
-    def test_clean_price_edge_cases(self):
-        """Test price cleaning edge cases"""
-        assert self.parser.clean_price("") == 0.0
-        assert self.parser.clean_price(None) == 0.0
-        assert self.parser.clean_price("Kein Preis") == 0.0
-    
-    def test_parse_relative_date(self):
+    def test_parse_relative_date(self, parser):
         """Test relative date parsing"""
-        result = self.parser.parse_relative_date("Heute")
+        result = parser.parse_relative_date("Heute")
+        assert result is not None
+        
+        result = parser.parse_relative_date("Gestern")
         assert result is not None
         
-        result = self.parser.parse_relative_date("Gestern")
+        result = parser.parse_relative_date("vor 3 Tagen")
         assert result is not None
+    
+    @pytest.mark.parametrize("prefix", [
+        "",
+        '<?xml version="1.0" encoding="utf-8"?>',
+    ])
+    def test_parse_search_results(self, parser, prefix):
+        """Test search result parsing, including pages with an encoding declaration"""
+        html = prefix + (
+            '<html><body><article class="aditem">'
+            '<a href="/s-anzeige/test/123"><h2 class="text-module-begin">Bücher</h2></a>'
+            '</article></body></html>'
+        )
+        
+        results = parser.parse_search_results(html)
         
-        result = self.parser.parse_relative_date("vor 3 Tagen")
-        assert result is not None
\ No newline at end of file
+        assert len(results) == 1
+        assert results[0]['url'].endswith('/s-anzeige/test/123')
+        assert results[0]['title'] == 'Bücher'
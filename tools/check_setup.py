@@ -6,8 +6,13 @@ This script checks if all requirements are met for running the crawler
 
 import sys
 import os
+import io
+import re
+import functools
+import threading
 import subprocess
-import importlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import importlib.metadata
 from pathlib import Path
 
 def check_python_version():
@@ -23,47 +28,74 @@ def check_python_version():
         print("  Please upgrade to Python 3.8 or higher")
         return False
 
+# Package -> installed distribution names that provide it, in lookup order
+CORE_PACKAGES = {
+    'selenium': ('selenium',),
+    'beautifulsoup4': ('beautifulsoup4',),
+    'lxml': ('lxml',),
+    'webdriver_manager': ('webdriver-manager',),
+    'sqlalchemy': ('SQLAlchemy',),
+    'psycopg2': ('psycopg2', 'psycopg2-binary'),
+    'yaml': ('PyYAML',),
+    'dotenv': ('python-dotenv',),
+    'loguru': ('loguru',),
+    'apscheduler': ('APScheduler',)
+}
+
+# Missing optional packages are reported but do not fail the check
+OPTIONAL_PACKAGES = {
+    'pandas': ('pandas',),
+    'schedule': ('schedule',),
+    'requests': ('requests',)
+}
+
+def _normalize(name):
+    """Canonical distribution name (PEP 503), so PyYAML matches pyyaml"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+@functools.lru_cache(maxsize=None)
+def _installed_distributions():
+    """Snapshot of installed distributions as {normalized name: version}, scanned once"""
+    installed = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata['Name']
+        if name:
+            installed.setdefault(_normalize(name), dist.version)
+    return installed
+
+def _installed_version(distributions):
+    """Return the version of the first installed distribution, or None"""
+    installed = _installed_distributions()
+    for name in distributions:
+        version = installed.get(_normalize(name))
+        if version is not None:
+            return version
+    return None
+
+def _report_packages(packages, missing_mark='✗'):
+    """Print the install state of each package and return the missing ones"""
+    missing = []
+    for package, distributions in packages.items():
+        version = _installed_version(distributions)
+        if version is not None:
+            print(f"✓ {package} is installed ({version})")
+        else:
+            missing.append(package)
+            print(f"{missing_mark} {package} is missing")
+    return missing
+
 def check_required_packages():
     """Check if all required packages are installed"""
     print("\n📦 Checking required packages...")
     
-    required_packages = [
-        'selenium',
-        'beautifulsoup4',
-        'sqlalchemy',
-        'loguru',
-        'yaml',
-        'dotenv',
-        'requests',
-        'pandas',
-        'schedule',
-        'apscheduler',
-        'psycopg2',
-        'webdriver_manager'
-    ]
+    # Read distribution metadata only; importing packages like pandas is slow
+    missing_packages = _report_packages(CORE_PACKAGES)
     
-    missing_packages = []
+    print("\n  Optional packages:")
+    missing_optional = _report_packages(OPTIONAL_PACKAGES, missing_mark='⚠')
     
-    for package in required_packages:
-        try:
-            # Handle package name differences
-            import_name = package
-            if package == 'yaml':
-                import_name = 'yaml'
-            elif package == 'dotenv':
-                import_name = 'dotenv'
-            elif package == 'beautifulsoup4':
-                import_name = 'bs4'
-            elif package == 'psycopg2':
-                import_name = 'psycopg2'
-            elif package == 'webdriver_manager':
-                import_name = 'webdriver_manager'
-            
-            importlib.import_module(import_name)
-            print(f"✓ {package} is installed")
-        except ImportError:
-            missing_packages.append(package)
-            print(f"✗ {package} is missing")
+    if missing_optional:
+        print(f"\n  Optional features need: pip3 install {' '.join(missing_optional)}")
     
     if missing_packages:
         print(f"\n  Install missing packages with:")
@@ -73,6 +105,15 @@ def check_required_packages():
         print("\n✓ All required packages are installed")
         return True
 
+def _chrome_version(cmd):
+    """Return the --version output of a browser binary, or None if unusable"""
+    try:
+        result = subprocess.run([cmd, '--version'], 
+                              capture_output=True, text=True, timeout=5)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
 def check_chrome_browser():
     """Check if Chrome browser is installed"""
     print("\n🌐 Checking Chrome browser...")
@@ -84,16 +125,19 @@ def check_chrome_browser():
         'chromium'
     ]
     
-    for cmd in chrome_commands:
-        try:
-            result = subprocess.run([cmd, '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                version = result.stdout.strip()
+    # Probe all candidates at once so a slow binary cannot delay the others
+    executor = ThreadPoolExecutor(max_workers=len(chrome_commands))
+    futures = [executor.submit(_chrome_version, cmd) for cmd in chrome_commands]
+    try:
+        for future in as_completed(futures):
+            version = future.result()
+            if version is not None:
                 print(f"✓ Chrome browser found: {version}")
                 return True
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            continue
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
     
     print("✗ Chrome browser not found")
     print("  Please install Google Chrome or Chromium browser")
@@ -101,6 +145,8 @@ def check_chrome_browser():
     print("  Or visit: https://www.google.com/chrome/")
     return False
 
+DB_ENV_VARS = ['DB_HOST', 'DB_NAME', 'DB_USER', 'DB_PASSWORD']
+
 def check_database_connection():
     """Check database connection (if configured)"""
     print("\n🗄️ Checking database configuration...")
@@ -111,11 +157,13 @@ def check_database_connection():
         print("  Copy .env.example to .env and configure database settings")
         return False
     
-    # Load environment variables
-    from dotenv import load_dotenv
-    load_dotenv()
+    # Load DB_* variables without overriding ones already set
+    from dotenv import dotenv_values
+    for name, value in dotenv_values('.env').items():
+        if name in DB_ENV_VARS and value is not None:
+            os.environ.setdefault(name, value)
     
-    db_vars = ['DB_HOST', 'DB_NAME', 'DB_USER', 'DB_PASSWORD']
+    db_vars = DB_ENV_VARS
     missing_vars = []
     
     for var in db_vars:
@@ -132,17 +180,32 @@ def check_database_connection():
     # Test database connection
     try:
         import psycopg2
-        
+    except ImportError as e:
+        print(f"✗ Database connection failed: {e}")
+        print("  Please install psycopg2-binary")
+        return False
+    
+    try:
+        # Bound the wait on unreachable hosts and exercise auth with a trivial query
         conn = psycopg2.connect(
             host=os.getenv('DB_HOST'),
             database=os.getenv('DB_NAME'),
             user=os.getenv('DB_USER'),
-            password=os.getenv('DB_PASSWORD')
+            password=os.getenv('DB_PASSWORD'),
+            connect_timeout=3
         )
-        conn.close()
+        try:
+            with conn.cursor() as cur:
+                cur.execute('SELECT 1')
+        finally:
+            conn.close()
         print("✓ Database connection successful")
         return True
         
+    except psycopg2.OperationalError as e:
+        print(f"✗ Database unreachable or login rejected: {str(e).strip()}")
+        print("  Please check DB_HOST and credentials, and ensure PostgreSQL is running")
+        return False
     except Exception as e:
         print(f"✗ Database connection failed: {e}")
         print("  Please check your database configuration and ensure PostgreSQL is running")
@@ -208,6 +271,30 @@ def check_disk_space():
         print(f"⚠ Could not check disk space: {e}")
         return True
 
+class _PerThreadOutput(io.TextIOBase):
+    """stdout replacement that sends each worker thread's prints to its own buffer"""
+    
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self._local = threading.local()
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self.fallback).write(text)
+    
+    def flush(self):
+        getattr(self._local, 'buffer', self.fallback).flush()
+
+def _run_buffered(check, output):
+    """Run a check with its output captured, returning (ok, error, text)"""
+    buffer = io.StringIO()
+    output._local.buffer = buffer
+    try:
+        return bool(check()), None, buffer.getvalue()
+    except Exception as e:
+        return False, e, buffer.getvalue()
+    finally:
+        del output._local.buffer
+
 def main():
     """Run all setup checks"""
     print("🚀 Kleinanzeigen Crawler - Setup Check")
@@ -225,14 +312,24 @@ def main():
     passed = 0
     failed = 0
     
-    for check in checks:
-        try:
-            if check():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"✗ Check {check.__name__} crashed: {e}")
+    # The checks are independent and mostly wait on subprocesses or the network,
+    # so run them concurrently and print each one's buffered output in order
+    output = _PerThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(_run_buffered, check, output) for check in checks]
+    finally:
+        sys.stdout = output.fallback
+    
+    for check, future in zip(checks, futures):
+        ok, error, text = future.result()
+        print(text, end='')
+        if error is not None:
+            print(f"✗ Check {check.__name__} crashed: {error}")
+        if ok:
+            passed += 1
+        else:
             failed += 1
     
     print("\n" + "=" * 50)
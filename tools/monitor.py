@@ -7,35 +7,55 @@ This script provides monitoring and statistics for the crawler
 import sys
 import os
 import argparse
+import functools
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import func, text
+from src.config import DatabaseManager, ConfigLoader
+from src.models import BookListing, CrawlSession
+
+# Rows removed per statement when purging old listings (PostgreSQL ctid batching)
+_DELETE_BATCH_SIZE = 10000
+_DELETE_OLD_LISTINGS_BATCH = text("""
+    DELETE FROM book_listings
+    WHERE ctid IN (
+        SELECT ctid FROM book_listings
+        WHERE is_active = false AND updated_at < :cutoff
+        LIMIT :batch_size
+    )
+""")
+
+@functools.lru_cache(maxsize=1)
+def _db():
+    """Load the configuration and build the database manager once per run"""
+    config = ConfigLoader()
+    return config, DatabaseManager(config.get('database', {}))
+
 def show_recent_sessions(limit=10):
     """Show recent crawl sessions"""
     print(f"📊 Recent Crawl Sessions (last {limit})")
     print("=" * 60)
     
     try:
-        from src.config import DatabaseManager, ConfigLoader
-        
-        config = ConfigLoader()
-        db_manager = DatabaseManager(config.get('database', {}))
+        config, db_manager = _db()
         
         with db_manager.get_session() as db:
-            from src.models import CrawlSession
-            
+            # Stream rows through a server-side cursor so large --sessions values
+            # don't materialize every ORM object at once
             sessions = db.query(CrawlSession).order_by(
                 CrawlSession.start_time.desc()
-            ).limit(limit).all()
-            
-            if not sessions:
-                print("No crawl sessions found")
-                return
+            ).limit(limit).execution_options(stream_results=True).yield_per(100)
             
+            found = False
             for session in sessions:
+                found = True
                 status_emoji = {
                     'completed': '✅',
                     'failed': '❌',
@@ -58,6 +78,9 @@ def show_recent_sessions(limit=10):
                     print(f"   Error: {session.error_message[:100]}...")
                 
                 print()
+            
+            if not found:
+                print("No crawl sessions found")
                 
     except Exception as e:
         print(f"Error fetching sessions: {e}")
@@ -68,20 +91,16 @@ def show_listing_stats():
     print("=" * 60)
     
     try:
-        from src.config import DatabaseManager, ConfigLoader
-        
-        config = ConfigLoader()
-        db_manager = DatabaseManager(config.get('database', {}))
+        config, db_manager = _db()
         
         with db_manager.get_session() as db:
-            from src.models import BookListing
-            from sqlalchemy import func
-            
-            # Total listings
-            total = db.query(func.count(BookListing.id)).scalar()
-            active = db.query(func.count(BookListing.id)).filter(
-                BookListing.is_active == True
-            ).scalar()
+            # Total, active and recent counts in a single round trip (COUNT ... FILTER)
+            week_ago = datetime.now() - timedelta(days=7)
+            total, active, recent = db.query(
+                func.count(BookListing.id),
+                func.count(BookListing.id).filter(BookListing.is_active == True),
+                func.count(BookListing.id).filter(BookListing.created_at >= week_ago)
+            ).one()
             
             print(f"Total listings: {total}")
             print(f"Active listings: {active}")
@@ -107,42 +126,101 @@ def show_listing_stats():
             
             # Recent listings
             print("Recent listings (last 7 days):")
-            week_ago = datetime.now() - timedelta(days=7)
-            recent = db.query(func.count(BookListing.id)).filter(
-                BookListing.created_at >= week_ago
-            ).scalar()
-            
             print(f"  New listings: {recent}")
             
     except Exception as e:
         print(f"Error fetching statistics: {e}")
 
+def _count_processes(needle):
+    """Count running processes whose name contains needle (lowercase bytes)
+    
+    Reads /proc/<pid>/comm directly on Linux and falls back to psutil elsewhere.
+    """
+    proc = Path('/proc')
+    if not proc.is_dir():
+        import psutil
+        needle_str = needle.decode()
+        return sum(1 for p in psutil.process_iter(['name']) if needle_str in (p.info['name'] or '').lower())
+    
+    count = 0
+    for pid_dir in proc.glob('[0-9]*'):
+        try:
+            name = (pid_dir / 'comm').read_bytes()
+        except OSError:
+            # Process exited between listing and reading
+            continue
+        if needle in name.lower():
+            count += 1
+    return count
+
+def _memory_usage():
+    """Return (percent used, bytes used, bytes total), read from /proc/meminfo on Linux"""
+    try:
+        with open('/proc/meminfo') as f:
+            fields = dict(line.split(':', 1) for line in f)
+    except OSError:
+        import psutil
+        memory = psutil.virtual_memory()
+        return memory.percent, memory.used, memory.total
+    
+    # Values are reported in kB
+    total = int(fields['MemTotal'].split()[0]) * 1024
+    available = int(fields['MemAvailable'].split()[0]) * 1024
+    used = total - available
+    return used / total * 100, used, total
+
+def _read_cpu_times():
+    """Return (idle, total) jiffies from the aggregate cpu line of /proc/stat"""
+    with open('/proc/stat') as f:
+        times = [int(value) for value in f.readline().split()[1:9]]
+    # idle + iowait; guest time is already counted in user
+    return times[3] + times[4], sum(times)
+
+def _cpu_percent(interval=0.1):
+    """Sample overall CPU utilisation over a short interval"""
+    try:
+        idle_before, total_before = _read_cpu_times()
+    except OSError:
+        import psutil
+        return psutil.cpu_percent(interval=interval)
+    
+    time.sleep(interval)
+    idle_after, total_after = _read_cpu_times()
+    
+    total_delta = total_after - total_before
+    if total_delta <= 0:
+        return 0.0
+    return (1 - (idle_after - idle_before) / total_delta) * 100
+
 def show_system_status():
     """Show system status"""
     print("🖥️ System Status")
     print("=" * 60)
     
     try:
-        import psutil
-        import shutil
-        
-        # Memory usage
-        memory = psutil.virtual_memory()
-        print(f"Memory: {memory.percent}% used ({memory.used / 1024**3:.1f} GB / {memory.total / 1024**3:.1f} GB)")
-        
-        # Disk usage
-        disk = shutil.disk_usage('.')
-        disk_percent = (disk.used / disk.total) * 100
-        print(f"Disk: {disk_percent:.1f}% used ({disk.used / 1024**3:.1f} GB / {disk.total / 1024**3:.1f} GB)")
+        # CPU sampling blocks for its interval, so run it while the other probes work
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cpu_future = executor.submit(_cpu_percent)
+            
+            # Memory usage
+            mem_percent, mem_used, mem_total = _memory_usage()
+            print(f"Memory: {mem_percent:.1f}% used ({mem_used / 1024**3:.1f} GB / {mem_total / 1024**3:.1f} GB)")
+            
+            # Disk usage
+            disk = shutil.disk_usage('.')
+            disk_percent = (disk.used / disk.total) * 100
+            print(f"Disk: {disk_percent:.1f}% used ({disk.used / 1024**3:.1f} GB / {disk.total / 1024**3:.1f} GB)")
+            
+            # Check if Chrome is running
+            chrome_procs = _count_processes(b'chrome')
+            
+            # CPU usage
+            cpu = cpu_future.result()
         
-        # CPU usage
-        cpu = psutil.cpu_percent(interval=1)
-        print(f"CPU: {cpu}% used")
+        print(f"CPU: {cpu:.1f}% used")
         
-        # Check if Chrome is running
-        chrome_procs = [p for p in psutil.process_iter(['pid', 'name']) if 'chrome' in p.info['name'].lower()]
         if chrome_procs:
-            print(f"Chrome processes: {len(chrome_procs)} running")
+            print(f"Chrome processes: {chrome_procs} running")
         else:
             print("Chrome processes: None running")
         
@@ -151,6 +229,23 @@ def show_system_status():
     except Exception as e:
         print(f"Error checking system status: {e}")
 
+def _tail_lines(path, count, chunk_size=8192):
+    """Return the last count lines of a file, reading backwards in chunks"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        
+        # Stop once the buffer holds more than count complete lines
+        while position > 0 and data.count(b'\n') <= count:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+    
+    recent = data.splitlines()[-count:] if count > 0 else []
+    return [line.decode('utf-8', errors='replace') for line in recent]
+
 def show_log_tail(lines=20):
     """Show recent log entries"""
     print(f"📝 Recent Log Entries (last {lines} lines)")
@@ -171,9 +266,7 @@ def show_log_tail(lines=20):
         latest_log = max(log_files, key=lambda f: f.stat().st_mtime)
         
         # Read last N lines
-        with open(latest_log, 'r') as f:
-            all_lines = f.readlines()
-            recent_lines = all_lines[-lines:]
+        recent_lines = _tail_lines(latest_log, lines)
         
         print(f"File: {latest_log.name}")
         print("-" * 40)
@@ -190,40 +283,38 @@ def cleanup_old_data(days=30):
     print("=" * 60)
     
     try:
-        from src.config import DatabaseManager, ConfigLoader
-        
-        config = ConfigLoader()
-        db_manager = DatabaseManager(config.get('database', {}))
+        config, db_manager = _db()
         
         cutoff_date = datetime.now() - timedelta(days=days)
         
         with db_manager.get_session() as db:
-            from src.models import BookListing, CrawlSession
-            
-            # Clean up old inactive listings
-            old_listings = db.query(BookListing).filter(
-                BookListing.is_active == False,
-                BookListing.updated_at < cutoff_date
-            ).count()
+            # Clean up old inactive listings in bounded batches, committing each one
+            # so locks are released and vacuum can reclaim space as we go
+            old_listings = 0
+            while True:
+                deleted = db.execute(
+                    _DELETE_OLD_LISTINGS_BATCH,
+                    {'cutoff': cutoff_date, 'batch_size': _DELETE_BATCH_SIZE}
+                ).rowcount
+                db.commit()
+                old_listings += deleted
+                
+                # A short batch means nothing is left to delete
+                if deleted < _DELETE_BATCH_SIZE:
+                    break
+                print(f"  ... {old_listings} inactive listings deleted so far")
             
             if old_listings > 0:
-                db.query(BookListing).filter(
-                    BookListing.is_active == False,
-                    BookListing.updated_at < cutoff_date
-                ).delete()
                 print(f"Deleted {old_listings} old inactive listings")
             
-            # Clean up old completed sessions
+            # Clean up old completed sessions; the delete reports its rowcount,
+            # so no separate count() is needed
             old_sessions = db.query(CrawlSession).filter(
                 CrawlSession.status == 'completed',
                 CrawlSession.end_time < cutoff_date
-            ).count()
+            ).delete(synchronize_session=False)
             
             if old_sessions > 0:
-                db.query(CrawlSession).filter(
-                    CrawlSession.status == 'completed',
-                    CrawlSession.end_time < cutoff_date
-                ).delete()
                 print(f"Deleted {old_sessions} old completed sessions")
             
             if old_listings == 0 and old_sessions == 0:
@@ -232,14 +323,18 @@ def cleanup_old_data(days=30):
         # Clean up old log files
         log_dir = Path('logs')
         if log_dir.exists():
-            old_logs = []
-            for log_file in log_dir.glob('*.log'):
-                if log_file.stat().st_mtime < cutoff_date.timestamp():
-                    old_logs.append(log_file)
-                    log_file.unlink()
+            cutoff_ts = cutoff_date.timestamp()
+            old_logs = 0
+            
+            # DirEntry.stat() reuses the data gathered while listing the directory
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.log') and entry.is_file() and entry.stat().st_mtime < cutoff_ts:
+                        os.unlink(entry.path)
+                        old_logs += 1
             
             if old_logs:
-                print(f"Deleted {len(old_logs)} old log files")
+                print(f"Deleted {old_logs} old log files")
         
     except Exception as e:
         print(f"Error during cleanup: {e}")